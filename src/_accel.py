@@ -0,0 +1,30 @@
+"""Optional native acceleration backends.
+
+Numba is an optional dependency: when it is installed, numeric kernels are
+JIT-compiled with ``njit``; otherwise ``njit`` degrades to a no-op decorator and
+callers use their NumPy/pure-Python implementations instead.
+"""
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - exercised only without numba installed
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+
+def njit(*args, **kwargs):
+    """``numba.njit`` when available, otherwise an identity decorator.
+
+    Supports both ``@njit`` and ``@njit(signature, cache=True, ...)`` forms.
+    """
+    if HAVE_NUMBA:
+        return numba.njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func):
+        return func
+
+    return decorator
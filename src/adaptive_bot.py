@@ -421,10 +421,7 @@ class AdaptiveBot:
             if variation in ticker_data:
                 return variation
 
-        if ticker_data:
-            return list(ticker_data.keys())[0]
-
-        return None
+        return next(iter(ticker_data), None)
 
     def place_order(self, order_type: str, price: Optional[float] = None) -> Optional[dict]:
         """Place an order."""
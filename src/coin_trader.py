@@ -9,6 +9,7 @@ from .analysis import MarketAnalyzer, StrategySelector, MarketCondition
 from .fee_calculator import FeeCalculator
 from .database import TradingDatabase
 from .config_utils import optional, require_bool, require_float, require_int
+from .market_data import ticker_last_price
 
 logger = logging.getLogger(__name__)
 
@@ -264,7 +265,7 @@ class CoinTrader:
                 return None
 
             ticker = ticker_data[pair_key]
-            close = float(ticker['c'][0])
+            close = ticker_last_price(ticker)
             high = float(ticker['h'][0])
             low = float(ticker['l'][0])
 
@@ -313,10 +314,7 @@ class CoinTrader:
                 return variation
 
         # Return first key if none match
-        if ticker_data:
-            return list(ticker_data.keys())[0]
-
-        return None
+        return next(iter(ticker_data), None)
 
     def record_entry(self, price: float, volume: float, fee: float = 0.0, dry_run: bool = True):
         """
@@ -461,6 +461,30 @@ class TradingDatabase:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    def get_open_positions(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get currently open positions for several symbols in one query.
+
+        Args:
+            symbols: Trading pairs to look up
+
+        Returns:
+            Mapping of symbol -> most recent open position (symbols without one are omitted)
+        """
+        if not symbols:
+            return {}
+
+        placeholders = ','.join('?' * len(symbols))
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT * FROM positions
+            WHERE symbol IN ({placeholders}) AND status = 'open'
+            ORDER BY entry_time ASC
+        """, tuple(symbols))
+
+        # Ascending order: later rows overwrite earlier ones, keeping the latest per symbol.
+        return {row['symbol']: dict(row) for row in cursor.fetchall()}
+
     def get_daily_stats(self, date: Optional[str] = None) -> Dict[str, Any]:
         """Get trading statistics for a specific date."""
         if date is None:
@@ -468,7 +492,7 @@ class TradingDatabase:
 
         cursor = self.conn.cursor()
 
-        # Get completed positions for the date
+        # Completed-position aggregates and the day's strategy switch count in one round-trip.
         cursor.execute("""
             SELECT
                 COUNT(*) as total_trades,
@@ -476,24 +500,18 @@ class TradingDatabase:
                 COALESCE(SUM(gross_pnl), 0) as gross_pnl,
                 COALESCE(SUM(total_fees), 0) as total_fees,
                 COALESCE(SUM(net_pnl), 0) as net_pnl,
-                GROUP_CONCAT(DISTINCT symbol) as coins_traded
+                GROUP_CONCAT(DISTINCT symbol) as coins_traded,
+                (
+                    SELECT COUNT(*)
+                    FROM strategy_switches
+                    WHERE DATE(timestamp) = :date
+                ) as strategy_switches
             FROM positions
-            WHERE DATE(closed_time) = ?
+            WHERE DATE(closed_time) = :date
             AND status = 'closed'
-        """, (date,))
-
-        stats = dict(cursor.fetchone())
+        """, {'date': date})
 
-        # Get strategy switches for the day
-        cursor.execute("""
-            SELECT COUNT(*) as switches
-            FROM strategy_switches
-            WHERE DATE(timestamp) = ?
-        """, (date,))
-
-        stats['strategy_switches'] = cursor.fetchone()['switches']
-
-        return stats
+        return dict(cursor.fetchone())
 
     def get_strategy_performance(self, symbol: str, strategy: str) -> Dict[str, Any]:
         """Get performance metrics for a specific strategy."""
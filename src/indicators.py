@@ -1,7 +1,30 @@
 """Technical indicators for trading strategies."""
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 import statistics
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def sum_in_order(values: Iterable[float]) -> float:
+    """
+    Sum values left to right with plain float additions.
+
+    ``sum()`` uses compensated summation for floats from Python 3.12 on; the compiled
+    kernels and the strategies' rolling sums add in plain order, so the indicators
+    they must reproduce exactly sum the same way on every Python version.
+
+    Args:
+        values: Numbers to add, in order
+
+    Returns:
+        The sum as a float
+    """
+    total = 0.0
+    for value in values:
+        total += value
+    return total
+
 
 def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
     """
@@ -25,8 +48,8 @@ def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
     losses = [-change if change < 0 else 0 for change in changes]
 
     # Calculate average gain and loss
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
+    avg_gain = sum_in_order(gains) / period
+    avg_loss = sum_in_order(losses) / period
 
     # Avoid division by zero
     if avg_loss == 0:
@@ -58,10 +81,10 @@ def calculate_bollinger_bands(
 
     # Calculate middle band (SMA)
     recent_prices = prices[-period:]
-    middle_band = sum(recent_prices) / period
+    middle_band = sum_in_order(recent_prices) / period
 
     # Calculate standard deviation
-    variance = sum((p - middle_band) ** 2 for p in recent_prices) / period
+    variance = sum_in_order((p - middle_band) ** 2 for p in recent_prices) / period
     std = variance ** 0.5
 
     # Calculate bands
@@ -84,7 +107,7 @@ def calculate_sma(prices: List[float], period: int) -> Optional[float]:
     """
     if len(prices) < period:
         return None
-    return sum(prices[-period:]) / period
+    return sum_in_order(prices[-period:]) / period
 
 
 def calculate_ema(prices: List[float], period: int) -> Optional[float]:
@@ -105,7 +128,7 @@ def calculate_ema(prices: List[float], period: int) -> Optional[float]:
     multiplier = 2 / (period + 1)
 
     # Start with SMA
-    ema = sum(prices[:period]) / period
+    ema = sum_in_order(prices[:period]) / period
 
     # Calculate EMA for remaining prices
     for price in prices[period:]:
@@ -128,23 +151,16 @@ def detect_support_resistance(
     Returns:
         Tuple of (support_levels, resistance_levels)
     """
-    if len(prices) < window * 2:
+    if len(prices) < window * 2 + 1:
         return ([], [])
 
-    support_levels = []
-    resistance_levels = []
-
-    # Find local minima (support) and maxima (resistance)
-    for i in range(window, len(prices) - window):
-        price = prices[i]
-
-        # Check if local minimum
-        if price == min(prices[i - window : i + window + 1]):
-            support_levels.append(price)
-
-        # Check if local maximum
-        if price == max(prices[i - window : i + window + 1]):
-            resistance_levels.append(price)
+    # Find local minima (support) and maxima (resistance): prices equal to the min/max of
+    # the window centred on them. Row j of the view is the window around index window + j.
+    arr = np.asarray(prices, dtype=np.float64)
+    windows = sliding_window_view(arr, 2 * window + 1)
+    centres = arr[window:arr.shape[0] - window]
+    support_levels = centres[centres == windows.min(axis=1)].tolist()
+    resistance_levels = centres[centres == windows.max(axis=1)].tolist()
 
     # Cluster nearby levels
     support_levels = _cluster_levels(support_levels, threshold)
@@ -214,7 +230,7 @@ def calculate_atr(
         true_range = max(high_low, high_close, low_close)
         true_ranges.append(true_range)
 
-    atr = sum(true_ranges) / period
+    atr = sum_in_order(true_ranges) / period
     return atr
 
 
@@ -446,35 +462,53 @@ def calculate_macd(
     Returns:
         Tuple of (macd_line, signal_line, histogram) or None if insufficient data
     """
-    if len(prices) < slow_period + signal_period:
+    if len(prices) < slow_period + signal_period or len(prices) < fast_period:
         return None
 
-    # Calculate fast and slow EMAs
-    fast_ema = calculate_ema(prices, fast_period)
-    slow_ema = calculate_ema(prices, slow_period)
+    # The EMA of every prefix is just the running EMA at that point, so one walk over
+    # the prices yields the MACD history (same operations, in the same order, as
+    # calling calculate_ema on each prefix).
+    fast_multiplier = 2 / (fast_period + 1)
+    slow_multiplier = 2 / (slow_period + 1)
+    signal_multiplier = 2 / (signal_period + 1)
+    fast_ema = slow_ema = signal_line = 0
+    macd_count = 0
+
+    for i, price in enumerate(prices):
+        # Each EMA starts as the SMA of its first `period` prices.
+        if i < fast_period:
+            fast_ema += price
+            if i == fast_period - 1:
+                fast_ema = fast_ema / fast_period
+        else:
+            fast_ema = (price - fast_ema) * fast_multiplier + fast_ema
 
-    if fast_ema is None or slow_ema is None:
-        return None
+        if i < slow_period:
+            slow_ema += price
+            if i == slow_period - 1:
+                slow_ema = slow_ema / slow_period
+        else:
+            slow_ema = (price - slow_ema) * slow_multiplier + slow_ema
 
-    # MACD line = Fast EMA - Slow EMA
-    macd_line = fast_ema - slow_ema
+        # MACD history starts once both EMAs exist; zero EMAs are skipped.
+        if i + 1 < slow_period or i + 1 < fast_period or not fast_ema or not slow_ema:
+            continue
 
-    # Calculate signal line (EMA of MACD line)
-    # We need to calculate MACD for all periods to get signal line
-    macd_values = []
-    for i in range(slow_period, len(prices) + 1):
-        f_ema = calculate_ema(prices[:i], fast_period)
-        s_ema = calculate_ema(prices[:i], slow_period)
-        if f_ema and s_ema:
-            macd_values.append(f_ema - s_ema)
+        # Signal line = EMA of the MACD history
+        macd_value = fast_ema - slow_ema
+        if macd_count < signal_period:
+            signal_line += macd_value
+            if macd_count == signal_period - 1:
+                signal_line = signal_line / signal_period
+        else:
+            signal_line = (macd_value - signal_line) * signal_multiplier + signal_line
+        macd_count += 1
 
-    if len(macd_values) < signal_period:
+    if macd_count < signal_period:
         return None
 
-    signal_line = calculate_ema(macd_values, signal_period)
-
-    if signal_line is None:
-        return None
+    # MACD line = Fast EMA - Slow EMA
+    macd_line = fast_ema - slow_ema
 
     # Histogram = MACD line - Signal line
     histogram = macd_line - signal_line
@@ -529,6 +563,8 @@ def find_swing_high_low(
 
     # Use last 'period' prices
     recent_prices = prices[-period:]
+    if isinstance(recent_prices, np.ndarray):
+        return (float(recent_prices.max()), float(recent_prices.min()))
 
     swing_high = max(recent_prices)
     swing_low = min(recent_prices)
@@ -1,10 +1,12 @@
 """Kraken API client wrapper."""
+import threading
 import time
 import hmac
 import hashlib
 import base64
 import urllib.parse
 from decimal import Decimal, ROUND_DOWN
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 import requests
 import logging
@@ -12,6 +14,34 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _decimal_quantum(decimals: int) -> Decimal:
+    """Quantum for `decimals` places (e.g. 2 -> Decimal('0.01')), built once per precision."""
+    return Decimal('1').scaleb(-decimals)
+
+
+@lru_cache(maxsize=512)
+def _parse_rule_bundle(
+    lot_decimals: Any,
+    pair_decimals: Any,
+    tick_size: Any,
+    ordermin: Any,
+    costmin: Any,
+) -> Tuple[int, int, Optional[Decimal], Optional[Decimal], Optional[Decimal]]:
+    """Parse the AssetPairs fields order normalization needs, memoized per pair's rules.
+
+    A pair's rules rarely change, so the Decimal parses are shared across orders.
+    Absent fields stay None.
+    """
+    return (
+        int(lot_decimals),
+        int(pair_decimals),
+        Decimal(str(tick_size)) if tick_size is not None else None,
+        Decimal(str(ordermin)) if ordermin is not None else None,
+        Decimal(str(costmin)) if costmin is not None else None,
+    )
+
+
 class KrakenClient:
     """Wrapper for Kraken REST API with authentication and error handling."""
 
@@ -28,14 +58,25 @@ class KrakenClient:
         """
         self.api_key = api_key
         self.api_secret = api_secret
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'SpiceTrader/1.0'
-        })
+        # requests.Session is not documented as thread-safe, and callers may overlap
+        # requests from a thread pool, so each thread gets its own session.
+        self._local = threading.local()
 
         # Cache AssetPairs metadata for order validation/rounding.
         self._asset_pairs_cache: Dict[str, Dict[str, Any]] = {}
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread (created on first use)."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'SpiceTrader/1.0'
+            })
+            self._local.session = session
+        return session
+
     def _get_kraken_signature(self, urlpath: str, data: Dict[str, Any], nonce: str) -> str:
         """
         Generate authentication signature for private endpoints.
@@ -215,8 +256,7 @@ class KrakenClient:
     def _round_down_decimal(value: Decimal, decimals: int) -> Decimal:
         if decimals < 0:
             return value
-        quant = Decimal('1').scaleb(-decimals)
-        return value.quantize(quant, rounding=ROUND_DOWN)
+        return value.quantize(_decimal_quantum(decimals), rounding=ROUND_DOWN)
 
     @staticmethod
     def _round_down_to_tick(value: Decimal, tick_size: Decimal) -> Decimal:
@@ -242,28 +282,31 @@ class KrakenClient:
         - Enforces `ordermin`
         - Enforces `costmin` when a price estimate is available
         """
-        lot_decimals = int(rules.get('lot_decimals', 8))
-        pair_decimals = int(rules.get('pair_decimals', 5))
+        ordermin = rules.get('ordermin')
+        costmin = rules.get('costmin')
+        lot_decimals, pair_decimals, tick_size, ordermin_dec, costmin_dec = _parse_rule_bundle(
+            rules.get('lot_decimals', 8),
+            rules.get('pair_decimals', 5),
+            rules.get('tick_size'),
+            ordermin,
+            costmin,
+        )
 
         volume_dec = Decimal(str(volume))
         volume_dec = cls._round_down_decimal(volume_dec, lot_decimals)
         if volume_dec <= 0:
             raise ValueError("Order volume rounds to 0")
 
-        ordermin = rules.get('ordermin')
-        if ordermin is not None:
-            if volume_dec < Decimal(str(ordermin)):
+        if ordermin_dec is not None:
+            if volume_dec < ordermin_dec:
                 raise ValueError(f"Order volume {volume_dec} below ordermin {ordermin}")
 
         normalized_price: Optional[Decimal] = None
         if price is not None and ordertype != 'market':
             price_dec = Decimal(str(price))
 
-            tick_size_raw = rules.get('tick_size')
-            if tick_size_raw is not None:
-                tick_size = Decimal(str(tick_size_raw))
-                if tick_size > 0:
-                    price_dec = cls._round_down_to_tick(price_dec, tick_size)
+            if tick_size is not None and tick_size > 0:
+                price_dec = cls._round_down_to_tick(price_dec, tick_size)
 
             price_dec = cls._round_down_decimal(price_dec, pair_decimals)
             if price_dec <= 0:
@@ -271,13 +314,12 @@ class KrakenClient:
             normalized_price = price_dec
 
         # Enforce minimum cost when we can estimate it.
-        costmin = rules.get('costmin')
         price_for_cost = normalized_price
         if price_for_cost is None and current_price is not None:
             price_for_cost = Decimal(str(current_price))
-        if costmin is not None and price_for_cost is not None:
+        if costmin_dec is not None and price_for_cost is not None:
             cost = volume_dec * price_for_cost
-            if cost < Decimal(str(costmin)):
+            if cost < costmin_dec:
                 raise ValueError(f"Order cost {cost} below costmin {costmin}")
 
         return (float(volume_dec), float(normalized_price) if normalized_price is not None else None)
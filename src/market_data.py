@@ -2,9 +2,48 @@
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Ticker entries carry the last trade price as a string (``'c': [price, lot volume]``);
+# the fetch layer parses it once and stores the float under this key.
+TICKER_LAST_PRICE_KEY = 'c_float'
+
+
+def annotate_last_price(ticker_entry: Dict[str, Any]) -> None:
+    """Parse a ticker entry's last trade price once and store it on the entry."""
+    try:
+        ticker_entry[TICKER_LAST_PRICE_KEY] = float(ticker_entry['c'][0])
+    except (KeyError, IndexError, TypeError, ValueError):
+        pass
+
+
+def ticker_last_price(ticker_entry: Dict[str, Any]) -> float:
+    """Last trade price of a ticker entry, using the pre-parsed value when present."""
+    price = ticker_entry.get(TICKER_LAST_PRICE_KEY)
+    return price if price is not None else float(ticker_entry['c'][0])
+
+
+def has_series(ohlc: Any, *fields: str) -> bool:
+    """True when ``ohlc`` is a series dict whose given fields are all non-empty.
+
+    Works for both list and ndarray series (arrays have no truth value).
+    """
+    if not isinstance(ohlc, dict):
+        return False
+    for field in fields:
+        values = ohlc.get(field)
+        if values is None or len(values) == 0:
+            return False
+    return True
+
+
+def as_float_list(values: Sequence[float]) -> List[float]:
+    """A series as a list of Python floats, for the list-based indicator helpers."""
+    return values.tolist() if isinstance(values, np.ndarray) else values
 
 
 @dataclass(frozen=True)
@@ -46,18 +85,105 @@ def _parse_ohlc_rows(rows: List[List[Any]]) -> List[OHLCCandle]:
     return candles
 
 
+# Float columns of _CandleColumns.values, in row order.
+_VALUE_FIELDS = ('open', 'high', 'low', 'close', 'vwap', 'volume')
+_VALUE_ROWS = {field: row for row, field in enumerate(_VALUE_FIELDS)}
+
+
+class _CandleColumns:
+    """Committed candles of one pair stored column-wise (oldest first).
+
+    Columns live in buffers twice ``maxlen`` long. The live window ``[start, end)``
+    slides forward on append and is only copied back to the front when it reaches the
+    end of the buffer, so every column is always a contiguous slice.
+
+    Once a column view has been handed out, the buffers are copy-on-write: compaction
+    and :meth:`replace_last` move the window to fresh buffers instead of overwriting
+    memory a view may still be reading. Appends only write past the end of every view.
+    """
+
+    __slots__ = ('maxlen', 'times', 'counts', 'values', 'start', 'end', 'shared')
+
+    def __init__(self, maxlen: int):
+        capacity = 2 * maxlen
+        self.maxlen = maxlen
+        self.times = np.empty(capacity, dtype=np.int64)
+        self.counts = np.empty(capacity, dtype=np.int64)
+        self.values = np.empty((len(_VALUE_FIELDS), capacity), dtype=np.float64)
+        self.start = 0
+        self.end = 0
+        self.shared = False
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def last_time(self) -> Optional[int]:
+        return int(self.times[self.end - 1]) if self.end > self.start else None
+
+    def append(self, candle: OHLCCandle) -> None:
+        if self.end == self.times.shape[0]:
+            self._compact()
+        self._write(self.end, candle)
+        self.end += 1
+        if self.end - self.start > self.maxlen:
+            self.start += 1
+
+    def replace_last(self, candle: OHLCCandle) -> None:
+        if self.shared:
+            self._compact()
+        self._write(self.end - 1, candle)
+
+    def _compact(self) -> None:
+        """Move the live window to the front, into fresh buffers if views are out."""
+        length = self.end - self.start
+        if self.shared:
+            times = np.empty_like(self.times)
+            counts = np.empty_like(self.counts)
+            values = np.empty_like(self.values)
+            self.shared = False
+        else:
+            times, counts, values = self.times, self.counts, self.values
+        times[:length] = self.times[self.start:self.end]
+        counts[:length] = self.counts[self.start:self.end]
+        values[:, :length] = self.values[:, self.start:self.end]
+        self.times, self.counts, self.values = times, counts, values
+        self.start, self.end = 0, length
+
+    def _write(self, index: int, candle: OHLCCandle) -> None:
+        self.times[index] = candle.time
+        self.counts[index] = candle.count
+        self.values[:, index] = (candle.open, candle.high, candle.low, candle.close, candle.vwap, candle.volume)
+
+    def column(self, field: str) -> np.ndarray:
+        view = self.values[_VALUE_ROWS[field], self.start:self.end]
+        view.flags.writeable = False
+        self.shared = True
+        return view
+
+    def candle(self, index: int) -> OHLCCandle:
+        open_, high, low, close, vwap, volume = self.values[:, index].tolist()
+        return OHLCCandle(
+            time=int(self.times[index]), open=open_, high=high, low=low, close=close,
+            vwap=vwap, volume=volume, count=int(self.counts[index]),
+        )
+
+
 class OHLCCache:
     """Caches committed OHLC candles per trading pair.
 
     Kraken's OHLC endpoint includes a final "current" (not-yet-committed) candle.
     This cache always drops that last candle when present.
+
+    Candles are stored as parallel float64 columns, and :meth:`get_series` hands out
+    read-only views of them rather than building lists. Later updates never modify
+    a view that has been handed out (see :class:`_CandleColumns`).
     """
 
     def __init__(self, interval: int = 1, maxlen: int = 200):
         self.interval = interval
         self.maxlen = maxlen
         self._since: Dict[str, int] = {}
-        self._candles: Dict[str, Deque[OHLCCandle]] = {}
+        self._candles: Dict[str, _CandleColumns] = {}
 
     def update(self, client: Any, pair: str) -> None:
         """Fetch and merge OHLC candles for pair."""
@@ -77,51 +203,49 @@ class OHLCCache:
         if len(candles) >= 2:
             candles = candles[:-1]
 
-        if not candles:
+        if not candles or self.maxlen <= 0:
             # Still update since cursor if present.
             last_val = result.get('last')
             if last_val is not None:
                 self._since[pair] = int(last_val)
             return
 
-        dq = self._candles.get(pair)
-        if dq is None:
-            dq = deque(maxlen=self.maxlen)
-            self._candles[pair] = dq
+        columns = self._candles.get(pair)
+        if columns is None:
+            columns = _CandleColumns(self.maxlen)
+            self._candles[pair] = columns
 
-        last_ts = dq[-1].time if dq else None
+        last_ts = columns.last_time()
         for candle in candles:
             if last_ts is None or candle.time > last_ts:
-                dq.append(candle)
+                columns.append(candle)
                 last_ts = candle.time
             elif candle.time == last_ts:
                 # Replace last candle if we got a newer version of same timestamp.
-                dq.pop()
-                dq.append(candle)
+                columns.replace_last(candle)
 
         last_val = result.get('last')
         if last_val is not None:
             self._since[pair] = int(last_val)
 
     def get_series(self, pair: str) -> Optional[Dict[str, Any]]:
-        """Return series dict: highs/lows/closes/volumes + latest candle."""
-        dq = self._candles.get(pair)
-        if not dq:
+        """Return series dict: highs/lows/closes/volumes + latest candle.
+
+        The series are read-only float64 arrays, oldest first, that share memory with
+        the cache; they keep the values they had when returned across later updates.
+        """
+        columns = self._candles.get(pair)
+        if not columns:
             return None
 
-        candles = list(dq)
-        highs = [c.high for c in candles]
-        lows = [c.low for c in candles]
-        closes = [c.close for c in candles]
-        volumes = [c.volume for c in candles]
-        latest = candles[-1]
+        latest = columns.candle(columns.end - 1)
 
         return {
             'interval': self.interval,
-            'highs': highs,
-            'lows': lows,
-            'closes': closes,
-            'volumes': volumes,
+            'highs': columns.column('high'),
+            'lows': columns.column('low'),
+            'closes': columns.column('close'),
+            'volumes': columns.column('volume'),
             'latest': {
                 'time': latest.time,
                 'open': latest.open,
@@ -135,7 +259,7 @@ class OHLCCache:
         }
 
     def get_latest_committed(self, pair: str) -> Optional[OHLCCandle]:
-        dq = self._candles.get(pair)
-        if not dq:
+        columns = self._candles.get(pair)
+        if not columns:
             return None
-        return dq[-1]
+        return columns.candle(columns.end - 1)
@@ -2,14 +2,15 @@
 import os
 import time
 import logging
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
 from .kraken.client import KrakenClient
 from .coin_trader import CoinTrader
 from .database import TradingDatabase
-from .market_data import OHLCCache
+from .market_data import OHLCCache, annotate_last_price, ticker_last_price
 from .position_sizing import equal_split_quote_allocation
 from .config_utils import ConfigError, require, require_bool, require_float, require_int
 
@@ -36,6 +37,10 @@ if len(handlers) == 1:
     logger.warning("Log file is not writable; falling back to console logging only")
 
 
+# Position sizing modes that split the quote balance equally across coins.
+_EQUAL_MODES = frozenset({"equal", "equal_split", "per_coin", "dynamic"})
+
+
 def _require_env(name: str) -> str:
     value = os.getenv(name)
     if value is None or not str(value).strip():
@@ -47,6 +52,29 @@ def _require_env(name: str) -> str:
     return value
 
 
+def _kraken_variations(symbol: str) -> Iterator[str]:
+    """Yield legacy Kraken pair-key spellings for a symbol (e.g. XBTUSD -> XXBTZUSD).
+
+    Generated lazily so callers can stop at the first hit without building
+    the remaining candidates.
+    """
+    yield symbol.replace('XBT', 'XXBT').replace('USD', 'ZUSD')
+    yield symbol.replace('ETH', 'XETH').replace('USD', 'ZUSD')
+    yield symbol.replace('XRP', 'XXRP').replace('USD', 'ZUSD')
+    yield symbol.replace('XMR', 'XXMR').replace('USD', 'ZUSD')
+
+
+def _resolve_variation(symbol: str, ticker_data: dict, altname_to_key: Dict[str, str]) -> Optional[str]:
+    """Find the ticker key for a symbol missing from the batch response under its own name.
+
+    Tries the AssetPairs altname mapping first, then the legacy variations.
+    """
+    mapped = altname_to_key.get(symbol)
+    if mapped and mapped in ticker_data:
+        return mapped
+    return next((v for v in _kraken_variations(symbol) if v in ticker_data), None)
+
+
 class MultiCoinBot:
     """
     Multi-coin adaptive trading bot.
@@ -73,6 +101,7 @@ class MultiCoinBot:
         self.trading_pairs = [pair.strip() for pair in trading_pairs_str.split(',') if pair.strip()]
         if not self.trading_pairs:
             raise ValueError("TRADING_PAIRS must contain at least one comma-separated pair")
+        self._pair_string = ','.join(self.trading_pairs)
 
         # Bot settings
         self.dry_run = require_bool(config, 'DRY_RUN')
@@ -82,6 +111,7 @@ class MultiCoinBot:
         self.max_total_exposure = require_float(config, 'MAX_TOTAL_EXPOSURE')  # % of account
         self.max_per_coin = require_float(config, 'MAX_PER_COIN')  # % of account
         self.position_sizing_mode = str(require(config, 'POSITION_SIZING_MODE')).strip().lower()
+        self._use_equal_split = self.position_sizing_mode in _EQUAL_MODES
         self.fee_buffer_pct = require_float(config, 'FEE_BUFFER_PCT')
 
         # OHLC settings (used for indicator correctness)
@@ -99,7 +129,11 @@ class MultiCoinBot:
         # Account state
         self.account_balance = 0.0
         self.total_exposure = 0.0
-        self.last_balance_log = time.time()
+        self.last_balance_log = time.monotonic()  # interval gate only, not a wall-clock timestamp
+
+        # Background pool for the two independent REST round-trips per iteration (balance +
+        # batch ticker). KrakenClient gives each worker thread its own HTTP session.
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
 
         print("\n" + "=" * 80)
         print("MULTI-COIN ADAPTIVE TRADING BOT")
@@ -122,14 +156,23 @@ class MultiCoinBot:
             logger.error(f"✗ Connection failed: {e}")
             return False
 
-    def update_account_balance(self) -> bool:
-        """Update account balance."""
+    def update_account_balance(self, trade_balance_future: Optional[Future] = None) -> bool:
+        """
+        Update account balance.
+
+        Args:
+            trade_balance_future: Optional in-flight ``get_trade_balance`` request
+                submitted to the I/O pool; fetched synchronously when omitted.
+        """
         try:
-            trade_balance = self.client.get_trade_balance()
+            if trade_balance_future is not None:
+                trade_balance = trade_balance_future.result()
+            else:
+                trade_balance = self.client.get_trade_balance()
             self.account_balance = float(trade_balance.get('eb', 0))
 
             # Log balance only every 60 seconds to reduce verbosity
-            current_time = time.time()
+            current_time = time.monotonic()
             if current_time - self.last_balance_log >= 60:
                 logger.info(f"Account Balance: ${self.account_balance:,.2f}")
                 self.last_balance_log = current_time
@@ -143,6 +186,8 @@ class MultiCoinBot:
         """Get market data for a symbol."""
         try:
             ticker = self.client.get_ticker(symbol)
+            for entry in ticker.values():
+                annotate_last_price(entry)
             # Enrich with committed OHLC series for indicator/strategy calculations.
             try:
                 self.ohlc_cache.update(self.client, symbol)
@@ -158,12 +203,21 @@ class MultiCoinBot:
             logger.error(f"[{symbol}] Failed to get market data: {e}")
             return None
 
-    def get_all_market_data(self) -> Optional[Dict[str, dict]]:
-        """Fetch market data for all symbols in one batch request."""
+    def get_all_market_data(self, ticker_future: Optional[Future] = None) -> Optional[Dict[str, dict]]:
+        """
+        Fetch market data for all symbols in one batch request.
+
+        Args:
+            ticker_future: Optional in-flight batch ``get_ticker`` request submitted
+                to the I/O pool; fetched synchronously when omitted.
+        """
         try:
             # Fetch ticker data for all trading pairs at once
-            pair_string = ','.join(self.trading_pairs)
-            ticker_data = self.client.get_ticker(pair_string)
+            pair_string = self._pair_string
+            if ticker_future is not None:
+                ticker_data = ticker_future.result()
+            else:
+                ticker_data = self.client.get_ticker(pair_string)
             timestamp = time.time()
 
             # Resolve Kraken's internal pair keys (e.g., XDGUSD, XXBTZUSD) via AssetPairs altname.
@@ -178,10 +232,10 @@ class MultiCoinBot:
                             if isinstance(alt, str) and alt:
                                 altname_to_key[alt] = k
             except Exception as e:
-                logger.debug(f"AssetPairs lookup failed (batch): {e}")
+                logger.debug("AssetPairs lookup failed (batch): %s", e)
 
             # Debug: log what Kraken returned
-            logger.debug(f"Kraken batch response keys: {list(ticker_data.keys())}")
+            logger.debug("Kraken batch response keys count: %d", len(ticker_data))
 
             # Build result mapping, handling Kraken's pair naming variations
             result = {}
@@ -190,48 +244,38 @@ class MultiCoinBot:
                 try:
                     self.ohlc_cache.update(self.client, symbol)
                 except Exception as e:
-                    logger.debug(f"[{symbol}] OHLC update failed (batch): {e}")
-
-                # Try exact match first, then try AssetPairs altname mapping, then common legacy variations.
-                key = symbol
-                variations: List[str] = []
-                if symbol not in ticker_data:
-                    mapped = altname_to_key.get(symbol)
-                    if mapped and mapped in ticker_data:
-                        key = mapped
-                    else:
-                        # Try common Kraken variations (legacy hard-coded cases).
-                        variations = [
-                            symbol.replace('XBT', 'XXBT').replace('USD', 'ZUSD'),
-                            symbol.replace('ETH', 'XETH').replace('USD', 'ZUSD'),
-                            symbol.replace('XRP', 'XXRP').replace('USD', 'ZUSD'),
-                            symbol.replace('XMR', 'XXMR').replace('USD', 'ZUSD'),
-                        ]
-                        for variation in variations:
-                            if variation in ticker_data:
-                                key = variation
-                                break
+                    logger.debug("[%s] OHLC update failed (batch): %s", symbol, e)
+
+                # Try exact match first (one dict probe in the common case), then fall back
+                # to the AssetPairs altname mapping and common legacy variations.
+                try:
+                    value = ticker_data[symbol]
+                    key = symbol
+                except KeyError:
+                    key = _resolve_variation(symbol, ticker_data, altname_to_key)
+                    value = ticker_data.get(key) if key is not None else None
 
                 # Only include if we found data
-                if key in ticker_data:
+                if value is not None:
+                    annotate_last_price(value)
                     result[symbol] = {
-                        'ticker': {key: ticker_data[key]},
+                        'ticker': {key: value},
                         'ohlc': self.ohlc_cache.get_series(symbol),
                         'timestamp': timestamp,
                     }
                 else:
-                    mapped = altname_to_key.get(symbol)
                     logger.warning(
-                        f"[{symbol}] Not found in Kraken response (tried: {symbol}, mapped={mapped}, variations={variations})"
+                        "[%s] Not found in Kraken response (tried: %s, mapped=%s, variations=%s)",
+                        symbol, symbol, altname_to_key.get(symbol), list(_kraken_variations(symbol)),
                     )
 
             if not result:
-                logger.error(f"No symbols found in Kraken response. Available: {list(ticker_data.keys())}")
+                logger.error("No symbols found in Kraken response. Available: %s", list(ticker_data))
                 return None
 
             return result
         except Exception as e:
-            logger.error(f"Failed to get batch market data: {e}")
+            logger.error("Failed to get batch market data: %s", e)
             return None
 
     def calculate_position_size(self, symbol: str, current_price: float) -> float:
@@ -254,7 +298,7 @@ class MultiCoinBot:
         max_coin_value = (self.account_balance * trader.max_position_pct) / 100
 
         # Optionally use equal-split sizing based on account balance.
-        if self.position_sizing_mode in {"equal", "equal_split", "per_coin", "dynamic"}:
+        if self._use_equal_split:
             per_coin_value = equal_split_quote_allocation(
                 self.account_balance,
                 len(self.trading_pairs),
@@ -334,14 +378,18 @@ class MultiCoinBot:
         print(f"ITERATION - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 80)
 
+        # Balance and batch ticker are independent round-trips; overlap them.
+        balance_future = self._io_pool.submit(self.client.get_trade_balance)
+        ticker_future = self._io_pool.submit(self.client.get_ticker, self._pair_string)
+
         # Update account balance
-        self.update_account_balance()
+        self.update_account_balance(balance_future)
 
         # Track signals
         signals = {}
 
         # Fetch all market data in single batch request
-        all_market_data = self.get_all_market_data()
+        all_market_data = self.get_all_market_data(ticker_future)
         if not all_market_data:
             logger.warning("Failed to fetch market data")
             return
@@ -367,14 +415,54 @@ class MultiCoinBot:
         if signals:
             logger.info(f"\n🎯 Executing {len(signals)} signal(s)...")
 
+            # Percentage sizing: BUYs executed this iteration draw down the exposure budget
+            # (percent of account); once it is used up, further BUYs are skipped. SELLs always run.
+            exposure_capped = not self._use_equal_split
+            exposure_budget = self.max_total_exposure - self.total_exposure
+            exposure_used = 0.0
+
+            # Enforce spot-style position management: one open position per symbol.
+            # Use DB as source of truth so restarts don't strand open positions.
+            open_positions: Dict[str, dict] = {}
+            if self.db:
+                try:
+                    open_positions = self.db.get_open_positions(list(signals)) or {}
+                except Exception as e:
+                    logger.warning(f"Failed to fetch open positions from DB: {e}")
+
+            # Bind per-iteration invariants once; the loop body runs per signal, forever.
+            traders = self.traders
+            config = self.config
+            client = self.client
+            dry_run = self.dry_run
+
             for symbol, signal in signals.items():
-                trader = self.traders[symbol]
+                trader = traders[symbol]
+                strategy = trader.current_strategy
 
                 # Check if already acted on this signal
-                if trader.current_strategy and signal == trader.current_strategy.last_signal:
+                if strategy and signal == strategy.last_signal:
                     logger.info(f"[{symbol}] Signal already acted upon, skipping")
                     continue
 
+                # Checked before the price fetch so skipped signals cost no extra request.
+                open_position = open_positions.get(symbol)
+
+                if signal == 'buy' and open_position:
+                    logger.info(f"[{symbol}] Skipping BUY - already have open position (id={open_position.get('id')})")
+                    continue
+
+                if signal == 'sell' and not open_position:
+                    logger.info(f"[{symbol}] Skipping SELL - no open position (spot mode; not opening shorts)")
+                    continue
+
+                if signal == 'buy' and exposure_capped and exposure_used >= exposure_budget:
+                    logger.warning(
+                        f"[{symbol}] Skipping BUY - max total exposure reached "
+                        f"({self.total_exposure + exposure_used:.1f}%)"
+                    )
+                    continue
+
                 # Get current price
                 market_data = self.get_market_data(symbol)
                 if not market_data:
@@ -385,29 +473,12 @@ class MultiCoinBot:
                 if not pair_key:
                     continue
 
-                current_price = float(ticker_data[pair_key]['c'][0])
-
-                # Enforce spot-style position management: one open position per symbol.
-                # Use DB as source of truth so restarts don't strand open positions.
-                open_position = None
-                if self.db:
-                    try:
-                        open_position = self.db.get_open_position(symbol)
-                    except Exception as e:
-                        logger.warning(f"[{symbol}] Failed to fetch open position from DB: {e}")
+                current_price = ticker_last_price(ticker_data[pair_key])
 
                 # Calculate position size
                 position_size = self.calculate_position_size(symbol, current_price)
 
                 if position_size > 0:
-                    if signal == 'buy' and open_position:
-                        logger.info(f"[{symbol}] Skipping BUY - already have open position (id={open_position.get('id')})")
-                        continue
-
-                    if signal == 'sell' and not open_position:
-                        logger.info(f"[{symbol}] Skipping SELL - no open position (spot mode; not opening shorts)")
-                        continue
-
                     # MACD-only exit gating (prevents fee-churn exits on tiny moves).
                     if signal == 'sell' and open_position and str(open_position.get('strategy', '')).lower() == 'macd':
                         try:
@@ -423,11 +494,11 @@ class MultiCoinBot:
 
                             hold_seconds = (datetime.now() - entry_dt).total_seconds() if entry_dt else None
                             gross_profit_pct = (current_price - entry_price) / entry_price
-                            taker_fee = float(self.config['TAKER_FEE'])
+                            taker_fee = float(config['TAKER_FEE'])
                             net_profit_pct = gross_profit_pct - (2.0 * taker_fee)
 
-                            min_hold_time = int(self.config['MIN_HOLD_TIME'])
-                            min_profit_target = float(self.config['MIN_PROFIT_TARGET'])
+                            min_hold_time = int(config['MIN_HOLD_TIME'])
+                            min_profit_target = float(config['MIN_PROFIT_TARGET'])
 
                             # Only gate *profitable* exits. Allow loss-cut exits immediately.
                             if net_profit_pct > 0:
@@ -449,24 +520,26 @@ class MultiCoinBot:
                     # Place order
                     success, txid = self.place_order(symbol, signal, position_size, current_price)
 
-                    if success and trader.current_strategy:
+                    if success and strategy:
                         # Get actual fee from Kraken if not in dry run
                         actual_fee = 0.0
-                        if not self.dry_run and txid:
+                        if not dry_run and txid:
                             logger.info(f"[{symbol}] Fetching actual fee for txid: {txid}")
-                            actual_fee = self.client.get_trade_actual_fee(txid, max_wait_seconds=10)
+                            actual_fee = client.get_trade_actual_fee(txid, max_wait_seconds=10)
                             if actual_fee > 0:
                                 logger.info(f"[{symbol}] Actual fee retrieved: ${actual_fee:.2f}")
 
                         # Record entry/exit for fee + DB tracking.
                         if signal == 'buy':
-                            trader.record_entry(current_price, position_size, fee=actual_fee, dry_run=self.dry_run)
-                            trader.current_strategy.update_position('long')
+                            trader.record_entry(current_price, position_size, fee=actual_fee, dry_run=dry_run)
+                            strategy.update_position('long')
+                            if self.account_balance > 0:
+                                exposure_used += position_size * current_price / self.account_balance * 100
                         else:  # sell
-                            trader.record_exit(current_price, position_size, fee=actual_fee, dry_run=self.dry_run)
-                            trader.current_strategy.update_position(None)
+                            trader.record_exit(current_price, position_size, fee=actual_fee, dry_run=dry_run)
+                            strategy.update_position(None)
 
-                        trader.current_strategy.update_signal(signal)
+                        strategy.update_signal(signal)
                         trader.total_trades += 1
 
                         logger.info(f"[{symbol}] ✅ {signal.upper()} executed: {position_size:.6f} @ ${current_price:,.2f}")
@@ -560,6 +633,7 @@ class MultiCoinBot:
         logger.info("=" * 80)
         self._display_summary()
 
+        self._io_pool.shutdown(wait=False)
         logger.info("Bot stopped")
 
 
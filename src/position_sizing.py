@@ -5,6 +5,9 @@ These helpers are intentionally pure (no API calls) so they can be unit tested.
 
 from __future__ import annotations
 
+import math
+from fractions import Fraction
+
 
 def equal_split_quote_allocation(
     quote_balance: float,
@@ -22,7 +25,7 @@ def equal_split_quote_allocation(
 
     Returns a quote-currency amount (e.g., USD) per coin.
     """
-    if quote_balance <= 0:
+    if quote_balance <= 0 or not math.isfinite(quote_balance):
         return 0.0
 
     if num_coins <= 0:
@@ -39,10 +42,11 @@ def equal_split_quote_allocation(
     if fee_buffer_pct >= 100.0:
         return 0.0
 
-    usable_value = quote_balance * (exposure_pct / 100.0)
-    usable_value *= (1.0 - (fee_buffer_pct / 100.0))
+    # Exact rational arithmetic on the float inputs, rounded once at the end, so the
+    # split does not pick up rounding from each intermediate product.
+    usable_value = Fraction(quote_balance) * Fraction(exposure_pct) * (100 - Fraction(fee_buffer_pct))
 
     if usable_value <= 0:
         return 0.0
 
-    return usable_value / float(num_coins)
+    return float(usable_value / (10000 * Fraction(num_coins)))
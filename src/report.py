@@ -3,6 +3,27 @@ import sys
 from datetime import datetime, timedelta
 from database import TradingDatabase
 
+BANNER = "=" * 80
+SEP = "-" * 80
+
+# Row templates for the fixed report schemas, parsed once at import instead of per row.
+# Fields are positional and follow the SELECT column order of the matching query, so
+# rows are fed straight in as tuples. String precision (e.g. ".19") truncates, matching
+# the timestamp[:19] display.
+TRADE_ROW_FMT = (
+    "{0:<20.19} {1:<10} {2:<6} {3:<5} ${4:<11,.2f} {5:<10.6f} ${6:<7.2f}"
+)
+OPEN_POSITION_ROW_FMT = (
+    "{0:<10} {1:<15} {2:<6} {3:<20.19} ${4:<11,.2f} {5:<10.6f}"
+)
+CLOSED_POSITION_ROW_FMT = (
+    "{0:<10} {1:<12} {2:<6} ${3:<9,.2f} ${4:<9,.2f} "
+    "${5:<9.2f} ${6:<7.2f} {7}${8:<9.2f} {9:<7.2f}%"
+)
+
+# Rows pulled per fetchmany() call; report rows are formatted as each batch arrives.
+FETCH_BATCH_SIZE = 64
+
 
 def print_daily_summary(db: TradingDatabase, date: str = None):
     """Print daily trading summary."""
@@ -11,9 +32,9 @@ def print_daily_summary(db: TradingDatabase, date: str = None):
 
     stats = db.get_daily_stats(date)
 
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print(f"DAILY SUMMARY - {date}")
-    print("=" * 80)
+    print(BANNER)
     print(f"Total Trades: {stats.get('total_trades', 0)}")
     print(f"Winning Trades: {stats.get('winning_trades', 0)}")
 
@@ -30,16 +51,16 @@ def print_daily_summary(db: TradingDatabase, date: str = None):
     if stats.get('coins_traded'):
         print(f"Coins Traded: {stats['coins_traded']}")
 
-    print("=" * 80)
+    print(BANNER)
 
 
 def print_strategy_performance(db: TradingDatabase, symbol: str, strategy: str):
     """Print performance for a specific strategy."""
     stats = db.get_strategy_performance(symbol, strategy)
 
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print(f"STRATEGY PERFORMANCE - {symbol} - {strategy.upper()}")
-    print("=" * 80)
+    print(BANNER)
     print(f"Total Trades: {stats.get('total_trades', 0)}")
     print(f"Winning Trades: {stats.get('winning_trades', 0)}")
     print(f"Losing Trades: {stats.get('losing_trades', 0)}")
@@ -53,54 +74,49 @@ def print_strategy_performance(db: TradingDatabase, symbol: str, strategy: str):
     print(f"Avg Loss: ${stats.get('avg_loss', 0):.2f}")
     print(f"Profit Factor: {stats.get('profit_factor', 0):.2f}")
 
-    print("=" * 80)
+    print(BANNER)
 
 
 def print_recent_trades(db: TradingDatabase, limit: int = 10):
     """Print recent trades."""
     cursor = db.conn.cursor()
+    cursor.row_factory = None  # plain tuples, unpacked positionally into the row template
     cursor.execute("""
         SELECT
             timestamp,
             symbol,
-            strategy,
             trade_type,
             side,
             price,
             volume,
-            fee,
-            value
+            fee
         FROM trades
         ORDER BY timestamp DESC
         LIMIT ?
     """, (limit,))
+    cursor.arraysize = FETCH_BATCH_SIZE
 
-    trades = cursor.fetchall()
-
-    print("\n" + "=" * 80)
-    print(f"RECENT TRADES (Last {limit})")
-    print("=" * 80)
-    print(f"{'Time':<20} {'Symbol':<10} {'Type':<6} {'Side':<5} {'Price':<12} {'Volume':<10} {'Fee':<8}")
-    print("-" * 80)
+    lines = [
+        "",
+        BANNER,
+        f"RECENT TRADES (Last {limit})",
+        BANNER,
+        f"{'Time':<20} {'Symbol':<10} {'Type':<6} {'Side':<5} {'Price':<12} {'Volume':<10} {'Fee':<8}",
+        SEP,
+    ]
 
-    for trade in trades:
-        trade_dict = dict(trade)
-        print(
-            f"{trade_dict['timestamp'][:19]:<20} "
-            f"{trade_dict['symbol']:<10} "
-            f"{trade_dict['trade_type']:<6} "
-            f"{trade_dict['side']:<5} "
-            f"${trade_dict['price']:<11,.2f} "
-            f"{trade_dict['volume']:<10.6f} "
-            f"${trade_dict['fee']:<7.2f}"
-        )
+    format_row = TRADE_ROW_FMT.format
+    while trades := cursor.fetchmany():
+        lines.extend(format_row(*trade) for trade in trades)
 
-    print("=" * 80)
+    lines.append(BANNER)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_open_positions(db: TradingDatabase):
     """Print currently open positions."""
     cursor = db.conn.cursor()
+    cursor.row_factory = None
     cursor.execute("""
         SELECT
             symbol,
@@ -108,42 +124,41 @@ def print_open_positions(db: TradingDatabase):
             position_type,
             entry_time,
             entry_price,
-            entry_volume,
-            entry_fee
+            entry_volume
         FROM positions
         WHERE status = 'open'
         ORDER BY entry_time DESC
     """)
+    cursor.arraysize = FETCH_BATCH_SIZE
 
-    positions = cursor.fetchall()
+    positions = cursor.fetchmany()
 
-    print("\n" + "=" * 80)
-    print("OPEN POSITIONS")
-    print("=" * 80)
+    lines = [
+        "",
+        BANNER,
+        "OPEN POSITIONS",
+        BANNER,
+    ]
 
     if not positions:
-        print("No open positions")
+        lines.append("No open positions")
     else:
-        print(f"{'Symbol':<10} {'Strategy':<15} {'Type':<6} {'Entry Time':<20} {'Entry Price':<12} {'Volume':<10}")
-        print("-" * 80)
+        lines.append(f"{'Symbol':<10} {'Strategy':<15} {'Type':<6} {'Entry Time':<20} {'Entry Price':<12} {'Volume':<10}")
+        lines.append(SEP)
 
-        for pos in positions:
-            pos_dict = dict(pos)
-            print(
-                f"{pos_dict['symbol']:<10} "
-                f"{pos_dict['strategy']:<15} "
-                f"{pos_dict['position_type']:<6} "
-                f"{pos_dict['entry_time'][:19]:<20} "
-                f"${pos_dict['entry_price']:<11,.2f} "
-                f"{pos_dict['entry_volume']:<10.6f}"
-            )
+        format_row = OPEN_POSITION_ROW_FMT.format
+        while positions:
+            lines.extend(format_row(*pos) for pos in positions)
+            positions = cursor.fetchmany()
 
-    print("=" * 80)
+    lines.append(BANNER)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_all_positions(db: TradingDatabase, limit: int = 20):
     """Print recent closed positions with P&L."""
     cursor = db.conn.cursor()
+    cursor.row_factory = None
     cursor.execute("""
         SELECT
             symbol,
@@ -154,61 +169,61 @@ def print_all_positions(db: TradingDatabase, limit: int = 20):
             gross_pnl,
             total_fees,
             net_pnl,
-            pnl_percent,
-            closed_time
+            pnl_percent
         FROM positions
         WHERE status = 'closed'
         ORDER BY closed_time DESC
         LIMIT ?
     """, (limit,))
+    cursor.arraysize = FETCH_BATCH_SIZE
 
-    positions = cursor.fetchall()
+    lines = [
+        "",
+        BANNER,
+        f"CLOSED POSITIONS (Last {limit})",
+        BANNER,
+        f"{'Symbol':<10} {'Strategy':<12} {'Type':<6} {'Entry':<10} {'Exit':<10} {'Gross':<10} {'Fees':<8} {'Net P&L':<10} {'%':<8}",
+        SEP,
+    ]
 
-    print("\n" + "=" * 80)
-    print(f"CLOSED POSITIONS (Last {limit})")
-    print("=" * 80)
-    print(f"{'Symbol':<10} {'Strategy':<12} {'Type':<6} {'Entry':<10} {'Exit':<10} {'Gross':<10} {'Fees':<8} {'Net P&L':<10} {'%':<8}")
-    print("-" * 80)
+    format_row = CLOSED_POSITION_ROW_FMT.format
+    while positions := cursor.fetchmany():
+        for symbol, strategy, position_type, entry, exit_, gross, fees, net, pct in positions:
+            lines.append(format_row(
+                symbol, strategy, position_type, entry, exit_, gross, fees,
+                "+" if net > 0 else "-", abs(net), pct,
+            ))
 
-    for pos in positions:
-        pos_dict = dict(pos)
-        pnl_color = "+" if pos_dict.get('net_pnl', 0) > 0 else "-"
-        print(
-            f"{pos_dict['symbol']:<10} "
-            f"{pos_dict['strategy']:<12} "
-            f"{pos_dict['position_type']:<6} "
-            f"${pos_dict['entry_price']:<9,.2f} "
-            f"${pos_dict['exit_price']:<9,.2f} "
-            f"${pos_dict['gross_pnl']:<9.2f} "
-            f"${pos_dict['total_fees']:<7.2f} "
-            f"{pnl_color}${abs(pos_dict['net_pnl']):<9.2f} "
-            f"{pos_dict['pnl_percent']:<7.2f}%"
-        )
-
-    print("=" * 80)
+    lines.append(BANNER)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main reporting function."""
     db = TradingDatabase()
 
-    print("\n" + "=" * 80)
+    print("\n" + BANNER)
     print("SPICETRADER PERFORMANCE REPORT")
-    print("=" * 80)
-
-    # Print today's summary
-    print_daily_summary(db)
-
-    # Print open positions
-    print_open_positions(db)
-
-    # Print recent closed positions
-    print_all_positions(db, limit=10)
-
-    # Print recent trades
-    print_recent_trades(db, limit=15)
-
-    db.close()
+    print(BANNER)
+
+    # Run every section inside one read transaction: a single lock acquisition, and all
+    # sections report from the same snapshot even if the bot writes meanwhile.
+    db.conn.execute("BEGIN")
+    try:
+        # Print today's summary
+        print_daily_summary(db)
+
+        # Print open positions
+        print_open_positions(db)
+
+        # Print recent closed positions
+        print_all_positions(db, limit=10)
+
+        # Print recent trades
+        print_recent_trades(db, limit=15)
+    finally:
+        db.conn.commit()
+        db.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,351 @@
+"""Numeric kernels used on the strategies' per-tick hot paths.
+
+Each kernel has a Numba implementation (compiled eagerly from an explicit
+signature and cached on disk) and a pure-Python fallback with the same contract,
+selected at import time depending on whether Numba is installed.
+"""
+import numpy as np
+
+from .._accel import HAVE_NUMBA, njit
+
+if HAVE_NUMBA:
+    from numba import types
+
+    # Read-only array types also accept writable arrays, so views handed out by
+    # caches can be passed straight through.
+    _F8_1D = types.Array(types.float64, 1, 'A', readonly=True)
+
+
+def _atr_is_high(highs, lows, closes, atr_period, lookback):
+    """
+    Check whether the current ATR is at or above its recent average.
+
+    Computes the ATR of every window ending at ``max(atr_period+1, n-(lookback+atr_period))..n``
+    (summed in the same order as ``calculate_atr``) and compares the last one against
+    the mean of the others.
+
+    Args:
+        highs: High prices (float64 array)
+        lows: Low prices (float64 array)
+        closes: Close prices (float64 array)
+        atr_period: ATR period
+        lookback: Number of trailing windows to average
+
+    Returns:
+        1.0 if the current ATR is high, else 0.0 (also 0.0 with fewer than 3 windows)
+    """
+    n = len(closes)
+    if n < atr_period + 2:
+        return 0.0
+    start = max(atr_period + 1, n - (lookback + atr_period))
+    count = n - start + 1
+    if count < 3:
+        return 0.0
+
+    total = 0.0
+    atr = 0.0
+    for end in range(start, n + 1):
+        window_sum = 0.0
+        for i in range(end - atr_period, end):
+            high_low = highs[i] - lows[i]
+            high_close = abs(highs[i] - closes[i - 1])
+            low_close = abs(lows[i] - closes[i - 1])
+            window_sum += max(high_low, high_close, low_close)
+        atr = window_sum / atr_period
+        if end < n:
+            total += atr
+
+    avg_atr = total / (count - 1)
+    return 1.0 if avg_atr > 0.0 and atr >= avg_atr else 0.0
+
+
+def _atr_is_high_python(highs, lows, closes, atr_period, lookback):
+    """Pure-Python fallback for :func:`atr_is_high_kernel` (list indexing beats ndarray scalars)."""
+    # Only the bars the last lookback + 1 windows touch are read, so only those are converted.
+    window = lookback + 2 * atr_period + 1
+    return _atr_is_high(
+        np.asarray(highs, dtype=np.float64)[-window:].tolist(),
+        np.asarray(lows, dtype=np.float64)[-window:].tolist(),
+        np.asarray(closes, dtype=np.float64)[-window:].tolist(),
+        atr_period, lookback,
+    )
+
+
+if HAVE_NUMBA:
+    atr_is_high_kernel = njit(
+        types.float64(_F8_1D, _F8_1D, _F8_1D, types.int64, types.int64), cache=True
+    )(_atr_is_high)
+else:
+    atr_is_high_kernel = _atr_is_high_python
+
+
+def _macd_advance(prices, offset, fast_ema, slow_ema, signal_ema, signal_count,
+                  fast_period, slow_period, signal_period):
+    """
+    Advance running MACD state over ``prices``, whose first element is series index ``offset``.
+
+    ``calculate_macd`` recomputes both EMAs over every prefix of the series; the EMA of
+    a prefix is simply the running EMA at that point, so walking the series once (or
+    resuming from a saved state) performs the same floating-point operations in the
+    same order. While an EMA is still inside its seed period it holds the running sum.
+
+    Args:
+        prices: Prices to consume, oldest first (float64 array)
+        offset: Series index of ``prices[0]``
+        fast_ema: Fast EMA state (0.0 for a fresh series)
+        slow_ema: Slow EMA state (0.0 for a fresh series)
+        signal_ema: Signal line state (0.0 for a fresh series)
+        signal_count: MACD values consumed by the signal line so far (0 for a fresh series)
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        Updated (fast_ema, slow_ema, signal_ema, signal_count)
+    """
+    fast_mult = 2 / (fast_period + 1)
+    slow_mult = 2 / (slow_period + 1)
+    signal_mult = 2 / (signal_period + 1)
+
+    for j in range(len(prices)):
+        price = prices[j]
+        i = offset + j
+
+        # Each EMA is seeded with the SMA of its first `period` prices.
+        if i < fast_period:
+            fast_ema += price
+            if i == fast_period - 1:
+                fast_ema = fast_ema / fast_period
+        else:
+            fast_ema = (price - fast_ema) * fast_mult + fast_ema
+
+        if i < slow_period:
+            slow_ema += price
+            if i == slow_period - 1:
+                slow_ema = slow_ema / slow_period
+        else:
+            slow_ema = (price - slow_ema) * slow_mult + slow_ema
+
+        # MACD history starts once both EMAs exist (and, as in calculate_macd, skips
+        # points where either EMA is exactly zero).
+        if i + 1 < slow_period or i + 1 < fast_period or fast_ema == 0.0 or slow_ema == 0.0:
+            continue
+        macd_value = fast_ema - slow_ema
+        if signal_count < signal_period:
+            signal_ema += macd_value
+            if signal_count == signal_period - 1:
+                signal_ema = signal_ema / signal_period
+        else:
+            signal_ema = (macd_value - signal_ema) * signal_mult + signal_ema
+        signal_count += 1
+
+    return fast_ema, slow_ema, signal_ema, signal_count
+
+
+def _macd_advance_python(prices, offset, fast_ema, slow_ema, signal_ema, signal_count,
+                         fast_period, slow_period, signal_period):
+    """Pure-Python fallback for :func:`macd_advance` (list indexing beats ndarray scalars)."""
+    return _macd_advance(
+        np.asarray(prices, dtype=np.float64).tolist(), offset, fast_ema, slow_ema, signal_ema, signal_count,
+        fast_period, slow_period, signal_period,
+    )
+
+
+if HAVE_NUMBA:
+    macd_advance = njit(
+        types.Tuple((types.float64, types.float64, types.float64, types.int64))(
+            _F8_1D, types.int64, types.float64, types.float64, types.float64, types.int64,
+            types.int64, types.int64, types.int64,
+        ),
+        cache=True,
+    )(_macd_advance)
+else:
+    macd_advance = _macd_advance_python
+
+
+def macd_from_state(length, state, fast_period, slow_period, signal_period):
+    """
+    MACD line, signal line and histogram from :func:`macd_advance` state.
+
+    Args:
+        length: Number of prices consumed into ``state``
+        state: (fast_ema, slow_ema, signal_ema, signal_count)
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        Tuple of (macd_line, signal_line, histogram); all NaN where ``calculate_macd``
+        returns None (insufficient data)
+    """
+    fast_ema, slow_ema, signal_ema, signal_count = state
+    if length < slow_period + signal_period or length < fast_period or signal_count < signal_period:
+        return np.nan, np.nan, np.nan
+    macd_line = fast_ema - slow_ema
+    return macd_line, signal_ema, macd_line - signal_ema
+
+
+def macd_kernel(prices, fast_period, slow_period, signal_period):
+    """
+    Latest MACD line, signal line and histogram in one pass over the prices.
+
+    Same values as ``calculate_macd`` in O(n) rather than O(n^2).
+
+    Args:
+        prices: Price series, most recent last (float64 array)
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        Tuple of (macd_line, signal_line, histogram); all NaN on insufficient data
+    """
+    state = macd_advance(prices, 0, 0.0, 0.0, 0.0, 0, fast_period, slow_period, signal_period)
+    return macd_from_state(len(prices), state, fast_period, slow_period, signal_period)
+
+
+def _macd_series(prices, window, fast_period, slow_period, signal_period):
+    """
+    MACD and signal line at every bar, each computed over the trailing ``window`` prices.
+
+    Matches calling :func:`macd_kernel` on ``prices[max(0, t - window + 1):t + 1]`` for each
+    bar ``t``: while the window is still growing the running state is extended by one
+    price, once it slides the window is walked again.
+
+    Args:
+        prices: Price series, oldest first (float64 array)
+        window: History length (the strategy's HISTORY_SIZE)
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period
+
+    Returns:
+        Tuple of (macd_line, signal_line) arrays; NaN on bars with insufficient data
+    """
+    n = len(prices)
+    macd_out = np.full(n, np.nan)
+    signal_out = np.full(n, np.nan)
+    fast_ema = 0.0
+    slow_ema = 0.0
+    signal_ema = 0.0
+    signal_count = 0
+    for t in range(n):
+        start = t - window + 1
+        if start <= 0:
+            fast_ema, slow_ema, signal_ema, signal_count = macd_advance(
+                prices[t:t + 1], t, fast_ema, slow_ema, signal_ema, signal_count,
+                fast_period, slow_period, signal_period,
+            )
+            length = t + 1
+        else:
+            fast_ema, slow_ema, signal_ema, signal_count = macd_advance(
+                prices[start:t + 1], 0, 0.0, 0.0, 0.0, 0, fast_period, slow_period, signal_period,
+            )
+            length = window
+        if length >= slow_period + signal_period and length >= fast_period and signal_count >= signal_period:
+            macd_out[t] = fast_ema - slow_ema
+            signal_out[t] = signal_ema
+    return macd_out, signal_out
+
+
+if HAVE_NUMBA:
+    macd_series = njit(
+        types.Tuple((types.float64[:], types.float64[:]))(
+            _F8_1D, types.int64, types.int64, types.int64, types.int64,
+        ),
+        cache=True,
+    )(_macd_series)
+else:
+    macd_series = _macd_series
+
+
+def _rsi_bollinger(prices, rsi_period, bb_period, std_dev, swing_period):
+    """
+    Latest RSI, Bollinger Bands and swing high/low of a price series.
+
+    The RSI changes, the Bollinger sum and the swing extrema are accumulated in a single
+    walk over the longest trailing window; only the band deviations need a second pass
+    over the (short) Bollinger window. Same definitions and summation order as
+    ``calculate_rsi`` (simple averages of the last ``rsi_period`` changes),
+    ``calculate_bollinger_bands`` (population standard deviation) and
+    ``find_swing_high_low``.
+
+    Args:
+        prices: Price series, most recent last (float64 array)
+        rsi_period: RSI period
+        bb_period: Bollinger Bands period
+        std_dev: Number of standard deviations for the bands
+        swing_period: Lookback for the swing high/low (at least 1)
+
+    Returns:
+        Tuple of (rsi, upper_band, middle_band, lower_band, swing_high, swing_low); the RSI
+        is NaN with fewer than ``rsi_period + 1`` prices, the bands with fewer than
+        ``bb_period`` and the swing points with fewer than ``swing_period``
+    """
+    n = len(prices)
+    rsi_start = n - rsi_period
+    bb_start = n - bb_period
+    swing_start = n - swing_period
+    start = max(0, min(rsi_start, bb_start, swing_start))
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    total = 0.0
+    swing_high = -np.inf
+    swing_low = np.inf
+    for i in range(start, n):
+        price = prices[i]
+        if i >= rsi_start and i >= 1:
+            change = price - prices[i - 1]
+            if change > 0:
+                gain_sum += change
+            elif change < 0:
+                loss_sum -= change
+        if i >= bb_start:
+            total += price
+        if i >= swing_start:
+            if price > swing_high:
+                swing_high = price
+            if price < swing_low:
+                swing_low = price
+
+    rsi = np.nan
+    if n >= rsi_period + 1:
+        avg_gain = gain_sum / rsi_period
+        avg_loss = loss_sum / rsi_period
+        if avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    if n < swing_period:
+        swing_high = np.nan
+        swing_low = np.nan
+
+    if n < bb_period:
+        return rsi, np.nan, np.nan, np.nan, swing_high, swing_low
+    middle = total / bb_period
+    squares = 0.0
+    for i in range(bb_start, n):
+        deviation = prices[i] - middle
+        squares += deviation * deviation
+    std = (squares / bb_period) ** 0.5
+    return rsi, middle + std_dev * std, middle, middle - std_dev * std, swing_high, swing_low
+
+
+def _rsi_bollinger_python(prices, rsi_period, bb_period, std_dev, swing_period):
+    """Pure-Python fallback for :func:`rsi_bollinger_kernel` (list indexing beats ndarray scalars)."""
+    # Only the longest trailing window is read, so only that much is converted.
+    window = max(rsi_period + 1, bb_period, swing_period)
+    return _rsi_bollinger(
+        np.asarray(prices, dtype=np.float64)[-window:].tolist(), rsi_period, bb_period, std_dev, swing_period
+    )
+
+
+if HAVE_NUMBA:
+    rsi_bollinger_kernel = njit(
+        types.UniTuple(types.float64, 6)(_F8_1D, types.int64, types.int64, types.float64, types.int64),
+        cache=True,
+    )(_rsi_bollinger)
+else:
+    rsi_bollinger_kernel = _rsi_bollinger_python
@@ -3,12 +3,28 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 from collections import deque
 
+import numpy as np
+
 from ..config_utils import require_int
 
 
+# Ticker keys tried, in priority order, when a strategy has to pick its pair out of a
+# ticker response; the frozenset lets _find_pair_key test them all in one intersection.
+_PAIR_VARIATIONS = ('XBTUSD', 'XXBTZUSD', 'BTCUSD', 'ETHUSD', 'XETHZUSD', 'SOLUSD', 'XRPUSD', 'XXRPZUSD')
+_PAIR_VARIATION_SET = frozenset(_PAIR_VARIATIONS)
+
+
 class TradingStrategy(ABC):
     """Abstract base class for trading strategies."""
 
+    # Subclasses that declare their own __slots__ keep instances dict-free; the rest
+    # simply get a __dict__ as before.
+    __slots__ = (
+        'config', 'price_history', 'position', 'last_signal', 'market_state',
+        '_price_buf', '_price_head', '_price_len', '_price_version',
+        '_prices_version', '_prices_array', '_prices_list', '_pair_key', '_closes_buf',
+    )
+
     def __init__(self, config: dict):
         """
         Initialize strategy with configuration.
@@ -17,7 +33,21 @@ class TradingStrategy(ABC):
             config: Strategy configuration dictionary
         """
         self.config = config
-        self.price_history: deque = deque(maxlen=require_int(config, 'HISTORY_SIZE'))
+        history_size = require_int(config, 'HISTORY_SIZE')
+        self.price_history: deque = deque(maxlen=history_size)
+        # Ring buffer mirroring price_history, so get_prices()/get_prices_array() can hand
+        # out a cached contiguous copy that is only rebuilt after add_price().
+        self._price_buf = np.empty(history_size, dtype=np.float64)
+        self._price_head = 0
+        self._price_len = 0
+        self._price_version = 0
+        self._prices_version = -1
+        self._prices_array: Optional[np.ndarray] = None
+        self._prices_list: Optional[List[float]] = None
+        # Reusable float64 buffer OHLC close series are copied into (see _closes_array()).
+        self._closes_buf = np.empty(history_size, dtype=np.float64)
+        # Ticker key resolved by _resolve_pair_key(); reused while it stays in the response.
+        self._pair_key: Optional[str] = None
         self.position = None  # None, 'long', or 'short'
         self.last_signal = None
         self.market_state = None  # Current market state (e.g., 'strong_uptrend', 'strong_downtrend')
@@ -48,15 +78,104 @@ class TradingStrategy(ABC):
             price: Price to add
         """
         self.price_history.append(price)
+        size = self._price_buf.size
+        if size:
+            self._price_buf[self._price_head] = price
+            self._price_head = (self._price_head + 1) % size
+            if self._price_len < size:
+                self._price_len += 1
+        self._price_version += 1
+
+    def get_prices_array(self) -> np.ndarray:
+        """
+        Get price history as a float64 array, oldest first.
+
+        The array is cached until the next add_price() and is read-only, so callers
+        share it without copying.
+
+        Returns:
+            Array of prices
+        """
+        if self._prices_version != self._price_version:
+            buf, head, length = self._price_buf, self._price_head, self._price_len
+            if length < buf.size:
+                prices = buf[:length].copy()
+            else:
+                prices = np.concatenate((buf[head:], buf[:head]))
+            prices.flags.writeable = False
+            self._prices_array = prices
+            self._prices_list = None
+            self._prices_version = self._price_version
+        return self._prices_array
 
     def get_prices(self) -> List[float]:
         """
         Get price history as a list.
 
+        The list is cached alongside get_prices_array() and must not be mutated.
+
         Returns:
             List of prices
         """
-        return list(self.price_history)
+        prices = self.get_prices_array()
+        if self._prices_list is None:
+            self._prices_list = prices.tolist()
+        return self._prices_list
+
+    def _closes_array(self, closes) -> np.ndarray:
+        """
+        Close series as a float64 array, copying into the reusable buffer only if needed.
+
+        Args:
+            closes: Close prices, most recent last
+
+        Returns:
+            ``closes`` itself when it already is a float64 array, else a view of the buffer
+            holding the closes (valid until the next call)
+        """
+        if isinstance(closes, np.ndarray) and closes.dtype == np.float64:
+            return closes
+        length = len(closes)
+        if self._closes_buf.shape[0] < length:
+            self._closes_buf = np.empty(length, dtype=np.float64)
+        view = self._closes_buf[:length]
+        view[:] = closes
+        return view
+
+    def _find_pair_key(self, ticker_data: dict) -> Optional[str]:
+        """
+        Find the actual trading pair key in ticker response.
+
+        Args:
+            ticker_data: Ticker data dictionary
+
+        Returns:
+            First known pair variation present, else the first key, else None
+        """
+        hits = _PAIR_VARIATION_SET.intersection(ticker_data)
+        if len(hits) == 1:
+            return next(iter(hits))
+        if hits:
+            return next(variation for variation in _PAIR_VARIATIONS if variation in hits)
+
+        # Return first key if none match
+        return next(iter(ticker_data), None)
+
+    def _resolve_pair_key(self, ticker_data: dict) -> Optional[str]:
+        """
+        Pair key for a ticker response, reusing the last resolved key while present.
+
+        Args:
+            ticker_data: Ticker data dictionary
+
+        Returns:
+            Pair key or None
+        """
+        pair_key = self._pair_key
+        if pair_key is None or pair_key not in ticker_data:
+            pair_key = self._find_pair_key(ticker_data)
+            self._pair_key = pair_key
+        return pair_key
 
     def has_sufficient_data(self, required_periods: int) -> bool:
         """
@@ -68,7 +187,8 @@ class TradingStrategy(ABC):
         Returns:
             True if sufficient data available
         """
-        return len(self.price_history) >= required_periods
+        # _price_len tracks len(price_history), capped at HISTORY_SIZE like the deque.
+        return self._price_len >= required_periods
 
     def update_position(self, position: Optional[str]) -> None:
         """
@@ -100,6 +220,10 @@ class TradingStrategy(ABC):
     def reset(self) -> None:
         """Reset strategy state."""
         self.price_history.clear()
+        self._price_head = 0
+        self._price_len = 0
+        self._price_version += 1
+        self._pair_key = None
         self.position = None
         self.last_signal = None
         self.market_state = None
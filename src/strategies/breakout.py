@@ -1,7 +1,14 @@
 """Breakout Strategy for volatile markets."""
 import logging
-from typing import Optional, Dict, Any
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Sequence, Tuple
+
+import numpy as np
+
 from .base import TradingStrategy
+from ._kernels import atr_is_high_kernel
 from ..indicators import (
     calculate_atr,
     calculate_volume_surge,
@@ -11,10 +18,58 @@ from ..indicators import (
     is_near_fibonacci_level
 )
 from ..config_utils import require_bool, require_float, require_int
+from ..market_data import as_float_list, has_series, ticker_last_price
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _fib_extensions(swing_high: float, swing_low: float) -> Mapping[str, float]:
+    """
+    Fibonacci extensions for a swing pair, memoized and read-only.
+
+    The swing high/low only move when a new extreme enters or leaves the lookback
+    window, so most ticks reuse the previous levels.
+
+    Args:
+        swing_high: Recent swing high price
+        swing_low: Recent swing low price
+
+    Returns:
+        Read-only mapping of Fibonacci extension levels
+    """
+    return MappingProxyType(calculate_fibonacci_extensions(swing_high, swing_low))
+
+
+def _detect_levels(
+    prices: Sequence[float], fib_lookback: Optional[int]
+) -> Tuple[tuple, tuple, Optional[Mapping[str, float]]]:
+    """
+    Support/resistance levels and Fibonacci extensions for a price series.
+
+    Args:
+        prices: Price series (most recent last)
+        fib_lookback: Swing lookback for Fibonacci extensions, or None when disabled
+
+    Returns:
+        Tuple of (support_levels, resistance_levels, fib_extensions or None)
+    """
+    support_levels, resistance_levels = detect_support_resistance(prices, window=10, threshold=0.02)
+
+    fib_extensions = None
+    if fib_lookback is not None and len(prices) >= fib_lookback:
+        swing_points = find_swing_high_low(prices, fib_lookback)
+        if swing_points:
+            swing_high, swing_low = swing_points
+            fib_extensions = _fib_extensions(swing_high, swing_low)
+
+    return tuple(support_levels), tuple(resistance_levels), fib_extensions
+
+
+# Committed-candle series repeat across polls within a candle; memoize on the exact series.
+_cached_levels = lru_cache(maxsize=8)(_detect_levels)
+
+
 class BreakoutStrategy(TradingStrategy):
     """
     Breakout Strategy for volatile markets.
@@ -28,6 +83,14 @@ class BreakoutStrategy(TradingStrategy):
     - EXIT: Price returns to range or hits stop loss
     """
 
+    __slots__ = (
+        'atr_period', 'atr_multiplier', 'volume_threshold', 'lookback_period', 'require_retest',
+        'last_resistance', 'last_support', 'breakout_confirmed', 'breakout_type', 'volume_history',
+        '_levels_key', '_levels', '_idle_poll_key',
+        'use_fibonacci', 'fib_lookback_period',
+        '_price_count', '_swing_high_dq', '_swing_low_dq',
+    )
+
     def __init__(self, config: dict):
         """
         Initialize Breakout strategy.
@@ -52,13 +115,26 @@ class BreakoutStrategy(TradingStrategy):
         self.breakout_confirmed = False
         self.breakout_type = None  # 'bullish' or 'bearish'
 
-        # Volume history
-        self.volume_history = []
+        # Volume history (bounded like price history)
+        self.volume_history: deque = deque(maxlen=self.price_history.maxlen)
+
+        # Levels computed for the last committed candle: (time, length, last close) -> levels
+        self._levels_key = None
+        self._levels = None
+
+        # Signal for the last committed candle seen by analyze(): (time, close) -> signal
+        self._idle_poll_key = None
 
         # Fibonacci analysis settings (for profit targets)
         self.use_fibonacci = require_bool(config, 'USE_FIBONACCI')
         self.fib_lookback_period = require_int(config, 'FIB_LOOKBACK_PERIOD')
 
+        # Sliding-window swing extrema over the last fib_lookback_period prices fed to
+        # add_price(): monotonic deques of (index, price), front = current high/low.
+        self._price_count = 0
+        self._swing_high_dq: deque = deque()
+        self._swing_low_dq: deque = deque()
+
         logger.info(f"Breakout Strategy initialized:")
         logger.info(f"  ATR Period: {self.atr_period}, Multiplier: {self.atr_multiplier}x")
         logger.info(f"  Volume Threshold: {self.volume_threshold}x average")
@@ -70,10 +146,51 @@ class BreakoutStrategy(TradingStrategy):
         """Return strategy name."""
         return "Breakout"
 
+    def add_price(self, price: float) -> None:
+        """Add a price to the history and update the swing high/low windows."""
+        super().add_price(price)
+        if not self.use_fibonacci:
+            return
+
+        index = self._price_count
+        self._price_count += 1
+        oldest = index - self.fib_lookback_period
+
+        high_dq = self._swing_high_dq
+        if high_dq and high_dq[0][0] <= oldest:
+            high_dq.popleft()
+        while high_dq and high_dq[-1][1] <= price:
+            high_dq.pop()
+        high_dq.append((index, price))
+
+        low_dq = self._swing_low_dq
+        if low_dq and low_dq[0][0] <= oldest:
+            low_dq.popleft()
+        while low_dq and low_dq[-1][1] >= price:
+            low_dq.pop()
+        low_dq.append((index, price))
+
+    def _swing_points(self) -> Optional[Tuple[float, float]]:
+        """
+        Swing high and low over the last fib_lookback_period prices.
+
+        Matches find_swing_high_low(self.get_prices(), self.fib_lookback_period).
+
+        Returns:
+            Tuple of (swing_high, swing_low) or None if insufficient data
+        """
+        if self._price_len < self.fib_lookback_period or not self._swing_high_dq:
+            return None
+        return self._swing_high_dq[0][1], self._swing_low_dq[0][1]
+
     def analyze(self, market_data: Dict[str, Any]) -> Optional[str]:
         """
         Analyze market data for breakout signals.
 
+        A poll that sees the same committed candle, position and breakout state as a
+        previous poll which returned None without changing that state returns None
+        again without recomputing any indicators.
+
         Args:
             market_data: Market data dictionary
 
@@ -81,119 +198,154 @@ class BreakoutStrategy(TradingStrategy):
             'buy', 'sell', or None
         """
         ohlc = market_data.get('ohlc')
+        poll_key = None
+        if has_series(ohlc, 'closes', 'highs', 'lows') and isinstance(ohlc.get('latest'), dict):
+            latest = ohlc['latest']
+            poll_key = (
+                latest.get('time'), latest.get('close'), latest.get('high'), latest.get('low'),
+                latest.get('volume'), self.position, self._breakout_state(),
+            )
+            if poll_key == self._idle_poll_key:
+                self.add_price(float(latest['close']))
+                return None
+        self._idle_poll_key = None
+
+        signal = self._evaluate(market_data)
+        # Only polls that left the breakout state as they found it qualify; otherwise the
+        # next poll starts from different state and must run in full.
+        if signal is None and poll_key is not None and poll_key[-1] == self._breakout_state():
+            self._idle_poll_key = poll_key
+        return signal
+
+    def _breakout_state(self) -> Tuple[Any, ...]:
+        """Snapshot of the state a poll may move."""
+        return (self.breakout_confirmed, self.breakout_type, self.last_resistance, self.last_support)
+
+    def _evaluate(self, market_data: Dict[str, Any]) -> Optional[str]:
+        """Run the full breakout analysis (see :meth:`analyze`)."""
+        ohlc = market_data.get('ohlc')
+        atr_period = self.atr_period
+        lookback_period = self.lookback_period
 
         # Prefer committed OHLC candles for correctness (high/low/volume per candle).
-        if isinstance(ohlc, dict) and ohlc.get('closes') and ohlc.get('highs') and ohlc.get('lows'):
-            closes = list(ohlc['closes'])
-            highs = list(ohlc['highs'])
-            lows = list(ohlc['lows'])
-            volumes = list(ohlc.get('volumes') or [])
+        if has_series(ohlc, 'closes', 'highs', 'lows'):
+            # The list-based indicator helpers iterate in Python, where lists beat arrays.
+            closes = as_float_list(ohlc['closes'])
+            highs = as_float_list(ohlc['highs'])
+            lows = as_float_list(ohlc['lows'])
+            volumes = as_float_list(ohlc['volumes']) if has_series(ohlc, 'volumes') else []
             current_price = float(ohlc['latest']['close']) if isinstance(ohlc.get('latest'), dict) else float(closes[-1])
 
             # Keep internal history in sync for any base-class helpers.
             self.add_price(current_price)
             if volumes:
-                self.volume_history = volumes[-self.price_history.maxlen:]
+                self.volume_history.clear()
+                self.volume_history.extend(volumes[-self.volume_history.maxlen:])
 
             # Need enough data across indicators.
-            required = max(self.lookback_period + 1, self.atr_period + 1, 21)
+            required = max(lookback_period + 1, atr_period + 1, 21)
             if len(closes) < required:
-                logger.info(f"Collecting data... ({len(closes)}/{required})")
+                logger.info("Collecting data... (%d/%d)", len(closes), required)
                 return None
 
             prices = closes
+            latest = ohlc.get('latest')
+            levels_key = (latest.get('time'), len(closes), closes[-1]) if isinstance(latest, dict) else None
         else:
             # Fallback: use ticker (less accurate for ATR/volume).
             ticker_data = market_data.get('ticker', {})
-            pair_key = self._find_pair_key(ticker_data)
+            pair_key = self._resolve_pair_key(ticker_data)
 
             if not pair_key:
                 logger.error("Trading pair not found in ticker data")
                 return None
 
             ticker = ticker_data[pair_key]
-            current_price = float(ticker['c'][0])
+            current_price = ticker_last_price(ticker)
             current_volume = float(ticker['v'][1])  # 24h volume (fallback only)
 
             self.add_price(current_price)
             self.volume_history.append(current_volume)
 
-            required = max(self.atr_period, self.lookback_period)
+            required = max(atr_period, lookback_period)
             if not self.has_sufficient_data(required):
-                logger.info(f"Collecting data... ({len(self.price_history)}/{required})")
+                logger.info("Collecting data... (%d/%d)", self._price_len, required)
                 return None
 
             prices = self.get_prices()
 
-            highs = [p * 1.005 for p in prices]
-            lows = [p * 0.995 for p in prices]
-
-        # Detect support and resistance levels
-        support_levels, resistance_levels = detect_support_resistance(
-            prices,
-            window=10,
-            threshold=0.02
-        )
+            # Synthetic candle range around each tick, vectorised over the cached history array.
+            prices_arr = self.get_prices_array()
+            highs = prices_arr * 1.005
+            lows = prices_arr * 0.995
+            levels_key = None
+
+        # Detect support and resistance levels (plus Fibonacci extensions). These depend only on
+        # the price series, so repeat polls on the same committed candle reuse the last result.
+        fib_lookback = self.fib_lookback_period if self.use_fibonacci else None
+        if levels_key is not None and levels_key == self._levels_key:
+            support_levels, resistance_levels, fib_extensions = self._levels
+        elif levels_key is not None:
+            support_levels, resistance_levels, fib_extensions = _cached_levels(tuple(prices), fib_lookback)
+            self._levels_key = levels_key
+            self._levels = (support_levels, resistance_levels, fib_extensions)
+        else:
+            # Ticker series change every tick; nothing to reuse. Swing points come from the
+            # windows maintained by add_price() instead of rescanning the lookback.
+            support_levels, resistance_levels = detect_support_resistance(prices, window=10, threshold=0.02)
+            swing_points = self._swing_points() if fib_lookback is not None else None
+            fib_extensions = _fib_extensions(*swing_points) if swing_points else None
 
         if not support_levels or not resistance_levels:
             logger.info("No clear support/resistance detected yet")
             return None
 
         # Get nearest levels
-        self.last_resistance = min([r for r in resistance_levels if r > current_price], default=None)
-        self.last_support = max([s for s in support_levels if s < current_price], default=None)
-
-        # Calculate Fibonacci extension levels if enabled (for profit targets)
-        fib_extensions = None
-        if self.use_fibonacci and len(prices) >= self.fib_lookback_period:
-            swing_points = find_swing_high_low(prices, self.fib_lookback_period)
-            if swing_points:
-                swing_high, swing_low = swing_points
-                fib_extensions = calculate_fibonacci_extensions(swing_high, swing_low)
+        self.last_resistance = min((r for r in resistance_levels if r > current_price), default=None)
+        self.last_support = max((s for s in support_levels if s < current_price), default=None)
 
-                # Log Fibonacci extension targets
-                logger.info(f"📐 Fibonacci Extension Targets:")
-                logger.info(f"   127.2%: ${fib_extensions['127.2%']:,.0f} | 161.8%: ${fib_extensions['161.8%']:,.0f} | 261.8%: ${fib_extensions['261.8%']:,.0f}")
+        # Fibonacci extension levels if enabled (for profit targets)
+        # Thousands separators have no %-style equivalent, so those lines are guarded instead.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if fib_extensions and log_info:
+            # Log Fibonacci extension targets
+            logger.info("📐 Fibonacci Extension Targets:")
+            logger.info(f"   127.2%: ${fib_extensions['127.2%']:,.0f} | 161.8%: ${fib_extensions['161.8%']:,.0f} | 261.8%: ${fib_extensions['261.8%']:,.0f}")
 
         # Calculate ATR for volatility confirmation
-        atr = calculate_atr(highs, lows, prices, self.atr_period)
+        atr = calculate_atr(highs, lows, prices, atr_period)
 
         if atr is None:
             return None
 
         # Check for volume surge (prefer per-candle volumes; fallback uses 24h volume history)
-        volume_series = self.volume_history
-        if isinstance(ohlc, dict) and ohlc.get('volumes'):
-            volume_series = list(ohlc['volumes'])
+        if has_series(ohlc, 'volumes'):
+            volume_series = as_float_list(ohlc['volumes'])
+        else:
+            # calculate_volume_surge slices, so materialize the deque.
+            volume_series = list(self.volume_history)
 
         volume_surge = calculate_volume_surge(volume_series, period=20, threshold=self.volume_threshold)
 
         # Log current state
-        logger.info(f"Price: ${current_price:,.2f} | ATR: ${atr:.2f} | Vol Surge: {volume_surge}")
-        if self.last_resistance:
-            logger.info(f"Resistance: ${self.last_resistance:,.2f} ({current_price/self.last_resistance*100-100:+.1f}%)")
-        if self.last_support:
-            logger.info(f"Support: ${self.last_support:,.2f} ({current_price/self.last_support*100-100:+.1f}%)")
+        if log_info:
+            logger.info(f"Price: ${current_price:,.2f} | ATR: ${atr:.2f} | Vol Surge: {volume_surge}")
+            if self.last_resistance:
+                logger.info(f"Resistance: ${self.last_resistance:,.2f} ({current_price/self.last_resistance*100-100:+.1f}%)")
+            if self.last_support:
+                logger.info(f"Support: ${self.last_support:,.2f} ({current_price/self.last_support*100-100:+.1f}%)")
 
         # Detect breakout conditions
 
         def atr_is_high(lookback: int = 20) -> bool:
             # Compare current ATR to average ATR over recent windows.
-            if len(prices) < self.atr_period + 2:
-                return False
-            start = max(self.atr_period + 1, len(prices) - (lookback + self.atr_period))
-            atr_vals = []
-            for end in range(start, len(prices) + 1):
-                window_highs = highs[max(0, end - (self.atr_period + 1)):end]
-                window_lows = lows[max(0, end - (self.atr_period + 1)):end]
-                window_closes = prices[max(0, end - (self.atr_period + 1)):end]
-                v = calculate_atr(window_highs, window_lows, window_closes, self.atr_period)
-                if v is not None:
-                    atr_vals.append(v)
-            if len(atr_vals) < 3:
-                return False
-            avg_atr = sum(atr_vals[:-1]) / max(1, (len(atr_vals) - 1))
-            return avg_atr > 0 and atr >= avg_atr
+            return atr_is_high_kernel(
+                np.asarray(highs, dtype=np.float64),
+                np.asarray(lows, dtype=np.float64),
+                np.asarray(prices, dtype=np.float64),
+                atr_period,
+                lookback,
+            ) > 0.0
 
         # BULLISH BREAKOUT: Breaking above resistance
         if self.last_resistance and current_price > self.last_resistance:
@@ -201,17 +353,18 @@ class BreakoutStrategy(TradingStrategy):
             atr_high = atr_is_high()
 
             if volume_surge and atr_high:
-                logger.info(f"🚀 BULLISH BREAKOUT DETECTED!")
-                logger.info(f"  ✓ Price broke resistance ${self.last_resistance:,.2f}")
-                logger.info(f"  ✓ Volume surge confirmed ({self.volume_threshold}x)")
-                logger.info(f"  ✓ High volatility (ATR)")
-
-                # Log Fibonacci profit targets if available
-                if fib_extensions:
-                    logger.info(f"  📊 Profit Targets (Fibonacci Extensions):")
-                    logger.info(f"     Target 1: ${fib_extensions['127.2%']:,.0f} (127.2%)")
-                    logger.info(f"     Target 2: ${fib_extensions['161.8%']:,.0f} (161.8% - Golden Ratio)")
-                    logger.info(f"     Target 3: ${fib_extensions['261.8%']:,.0f} (261.8%)")
+                if log_info:
+                    logger.info("🚀 BULLISH BREAKOUT DETECTED!")
+                    logger.info(f"  ✓ Price broke resistance ${self.last_resistance:,.2f}")
+                    logger.info("  ✓ Volume surge confirmed (%sx)", self.volume_threshold)
+                    logger.info("  ✓ High volatility (ATR)")
+
+                    # Log Fibonacci profit targets if available
+                    if fib_extensions:
+                        logger.info("  📊 Profit Targets (Fibonacci Extensions):")
+                        logger.info(f"     Target 1: ${fib_extensions['127.2%']:,.0f} (127.2%)")
+                        logger.info(f"     Target 2: ${fib_extensions['161.8%']:,.0f} (161.8% - Golden Ratio)")
+                        logger.info(f"     Target 3: ${fib_extensions['261.8%']:,.0f} (261.8%)")
 
                 if not self.require_retest or self.breakout_confirmed:
                     return 'buy'
@@ -226,14 +379,15 @@ class BreakoutStrategy(TradingStrategy):
             atr_high = atr_is_high()
 
             if volume_surge and atr_high:
-                logger.info(f"🔻 BEARISH BREAKOUT DETECTED!")
-                logger.info(f"  ✓ Price broke support ${self.last_support:,.2f}")
-                logger.info(f"  ✓ Volume surge confirmed ({self.volume_threshold}x)")
-                logger.info(f"  ✓ High volatility (ATR)")
+                if log_info:
+                    logger.info("🔻 BEARISH BREAKOUT DETECTED!")
+                    logger.info(f"  ✓ Price broke support ${self.last_support:,.2f}")
+                    logger.info("  ✓ Volume surge confirmed (%sx)", self.volume_threshold)
+                    logger.info("  ✓ High volatility (ATR)")
 
-                # Note: For bearish breakouts, consider inverse Fibonacci extensions
-                if fib_extensions:
-                    logger.info(f"  ⚠️  Consider exiting positions or setting stop losses")
+                    # Note: For bearish breakouts, consider inverse Fibonacci extensions
+                    if fib_extensions:
+                        logger.info("  ⚠️  Consider exiting positions or setting stop losses")
 
                 if not self.require_retest or self.breakout_confirmed:
                     return 'sell'
@@ -260,27 +414,13 @@ class BreakoutStrategy(TradingStrategy):
                     return 'sell'
 
         # No breakout signal
-        status = "Within range"
-        if self.last_support and self.last_resistance:
-            range_position = (current_price - self.last_support) / (self.last_resistance - self.last_support) * 100
-            status = f"In range ({range_position:.0f}% from support to resistance)"
-
-        logger.info(f"Status: {status} | Position: {self.position or 'None'}")
-        return None
-
-    def _find_pair_key(self, ticker_data: dict) -> Optional[str]:
-        """Find the actual trading pair key in ticker response."""
-        # Try common variations
-        variations = ['XBTUSD', 'XXBTZUSD', 'BTCUSD', 'ETHUSD', 'XETHZUSD', 'SOLUSD', 'XRPUSD', 'XXRPZUSD']
-
-        for variation in variations:
-            if variation in ticker_data:
-                return variation
-
-        # Return first key if none match
-        if ticker_data:
-            return list(ticker_data.keys())[0]
+        if log_info:
+            status = "Within range"
+            if self.last_support and self.last_resistance:
+                range_position = (current_price - self.last_support) / (self.last_resistance - self.last_support) * 100
+                status = f"In range ({range_position:.0f}% from support to resistance)"
 
+            logger.info("Status: %s | Position: %s", status, self.position or 'None')
         return None
 
     def reset(self) -> None:
@@ -291,3 +431,9 @@ class BreakoutStrategy(TradingStrategy):
         self.breakout_confirmed = False
         self.breakout_type = None
         self.volume_history.clear()
+        self._levels_key = None
+        self._levels = None
+        self._idle_poll_key = None
+        self._price_count = 0
+        self._swing_high_dq.clear()
+        self._swing_low_dq.clear()
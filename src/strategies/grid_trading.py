@@ -1,11 +1,19 @@
 """Grid Trading Strategy for tight ranging markets."""
 import logging
-from typing import Optional, Dict, Any, List
+from bisect import bisect_left
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
+
 from .base import TradingStrategy
 from ..config_utils import require_float, require_int
+from ..market_data import ticker_last_price
 
 logger = logging.getLogger(__name__)
 
+# A level triggers when price is within this fraction of it (0.1%).
+TRIGGER_TOLERANCE = 0.001
+
 
 class GridTradingStrategy(TradingStrategy):
     """
@@ -35,24 +43,29 @@ class GridTradingStrategy(TradingStrategy):
         self.grid_size = require_int(config, 'GRID_SIZE')
         self.grid_spacing_pct = require_float(config, 'GRID_SPACING_PCT')
         self.grid_center = None  # Will be set based on current price
+        self._strategy_name = f"Grid Trading ({self.grid_size} levels)"
 
-        # Track grid levels and orders
+        # Track grid levels (ascending) and filled orders as bitmasks over level index
         self.buy_levels = []
         self.sell_levels = []
-        self.filled_buys = set()
-        self.filled_sells = set()
+        self._grid_levels: List[float] = []  # buy_levels + sell_levels, ascending
+        # Per-level (low, high) trigger bands, parallel to buy_levels / sell_levels
+        self._buy_bands: List[Tuple[float, float]] = []
+        self._sell_bands: List[Tuple[float, float]] = []
+        self.filled_buy_mask = 0
+        self.filled_sell_mask = 0
 
         # Grid bounds
         self.upper_bound = None
         self.lower_bound = None
 
-        logger.info(f"Grid Trading Strategy initialized:")
-        logger.info(f"  Grid Size: {self.grid_size} levels")
-        logger.info(f"  Spacing: {self.grid_spacing_pct}% per level")
+        logger.info("Grid Trading Strategy initialized:")
+        logger.info("  Grid Size: %d levels", self.grid_size)
+        logger.info("  Spacing: %s%% per level", self.grid_spacing_pct)
 
     def get_strategy_name(self) -> str:
         """Return strategy name."""
-        return f"Grid Trading ({self.grid_size} levels)"
+        return self._strategy_name
 
     def analyze(self, market_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -66,26 +79,27 @@ class GridTradingStrategy(TradingStrategy):
         """
         # Extract current price from ticker
         ticker_data = market_data.get('ticker', {})
-        pair_key = self._find_pair_key(ticker_data)
+        pair_key = self._resolve_pair_key(ticker_data)
 
         if not pair_key:
             logger.error("Trading pair not found in ticker data")
             return None
 
         # Get current price
-        current_price = float(ticker_data[pair_key]['c'][0])
+        current_price = ticker_last_price(ticker_data[pair_key])
         self.add_price(current_price)
 
         # Need some data to establish grid center
         if not self.has_sufficient_data(10):
-            logger.debug(f"Collecting data... ({len(self.price_history)}/{10})")
+            logger.debug("Collecting data... (%d/%d)", self._price_len, 10)
             return None
 
         # Initialize grid if not set
         if self.grid_center is None:
             self._initialize_grid(current_price)
-            logger.info(f"Grid initialized at ${self.grid_center:,.2f}")
-            logger.info(f"Range: ${self.lower_bound:,.2f} - ${self.upper_bound:,.2f}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Grid initialized at ${self.grid_center:,.2f}")
+                logger.info(f"Range: ${self.lower_bound:,.2f} - ${self.upper_bound:,.2f}")
             return None
 
         # Check if price is out of grid bounds
@@ -99,38 +113,47 @@ class GridTradingStrategy(TradingStrategy):
             return None
 
         # Find nearest grid levels
-        nearest_buy_level = self._find_nearest_level(current_price, self.buy_levels, below=True)
-        nearest_sell_level = self._find_nearest_level(current_price, self.sell_levels, below=False)
-
-        # Log current position in grid
-        logger.info(f"Price: ${current_price:,.2f}")
-        if nearest_buy_level:
-            logger.info(f"Nearest Buy Level: ${nearest_buy_level:,.2f} ({(current_price/nearest_buy_level-1)*100:+.2f}%)")
-        if nearest_sell_level:
-            logger.info(f"Nearest Sell Level: ${nearest_sell_level:,.2f} ({(nearest_sell_level/current_price-1)*100:+.2f}%)")
+        nearest_buy, nearest_sell = self._find_bracket(current_price)
+        buy_idx, nearest_buy_level = nearest_buy if nearest_buy else (None, None)
+        sell_idx, nearest_sell_level = nearest_sell if nearest_sell else (None, None)
+
+        # Log current position in grid. Thousands separators have no %-style equivalent,
+        # so these lines are guarded instead.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"Price: ${current_price:,.2f}")
+            if nearest_buy_level:
+                logger.info(f"Nearest Buy Level: ${nearest_buy_level:,.2f} ({(current_price/nearest_buy_level-1)*100:+.2f}%)")
+            if nearest_sell_level:
+                logger.info(f"Nearest Sell Level: ${nearest_sell_level:,.2f} ({(nearest_sell_level/current_price-1)*100:+.2f}%)")
 
         # Grid trading signals
 
         # BUY SIGNAL: Price near a buy level that hasn't been filled
-        if nearest_buy_level and nearest_buy_level not in self.filled_buys:
+        if nearest_buy_level and not (self.filled_buy_mask >> buy_idx) & 1:
             # Check if price is close enough to level (within 0.1%)
-            if abs(current_price - nearest_buy_level) / nearest_buy_level < 0.001:
-                logger.info(f"🟢 BUY signal at grid level ${nearest_buy_level:,.2f}")
-                self.filled_buys.add(nearest_buy_level)
+            low, high = self._buy_bands[buy_idx]
+            if low < current_price < high:
+                if log_info:
+                    logger.info(f"🟢 BUY signal at grid level ${nearest_buy_level:,.2f}")
+                self.filled_buy_mask |= 1 << buy_idx
                 return 'buy'
 
         # SELL SIGNAL: Price near a sell level that hasn't been filled
-        if nearest_sell_level and nearest_sell_level not in self.filled_sells:
+        if nearest_sell_level and not (self.filled_sell_mask >> sell_idx) & 1:
             # Check if price is close enough to level (within 0.1%)
-            if abs(current_price - nearest_sell_level) / nearest_sell_level < 0.001:
-                logger.info(f"🔴 SELL signal at grid level ${nearest_sell_level:,.2f}")
-                self.filled_sells.add(nearest_sell_level)
+            low, high = self._sell_bands[sell_idx]
+            if low < current_price < high:
+                if log_info:
+                    logger.info(f"🔴 SELL signal at grid level ${nearest_sell_level:,.2f}")
+                self.filled_sell_mask |= 1 << sell_idx
                 return 'sell'
 
         # Show grid status
-        filled_buys = len(self.filled_buys)
-        filled_sells = len(self.filled_sells)
-        logger.info(f"Grid Status: {filled_buys} buys filled, {filled_sells} sells filled | Position: {self.position or 'None'}")
+        logger.info(
+            "Grid Status: %d buys filled, %d sells filled | Position: %s",
+            self.filled_buy_mask.bit_count(), self.filled_sell_mask.bit_count(), self.position or 'None',
+        )
 
         return None
 
@@ -142,69 +165,72 @@ class GridTradingStrategy(TradingStrategy):
             center_price: Center price for the grid
         """
         self.grid_center = center_price
-        self.buy_levels = []
-        self.sell_levels = []
-        self.filled_buys = set()
-        self.filled_sells = set()
+        self.filled_buy_mask = 0
+        self.filled_sell_mask = 0
 
-        # Calculate grid levels
+        # Calculate grid levels: offset i (1..half_grid) is (spacing% / 100) * i from center.
         half_grid = self.grid_size // 2
+        offsets = (self.grid_spacing_pct / 100) * np.arange(1, half_grid + 1, dtype=np.float64)
 
-        # Buy levels (below center)
-        for i in range(1, half_grid + 1):
-            level = center_price * (1 - (self.grid_spacing_pct / 100) * i)
-            self.buy_levels.append(level)
-
-        # Sell levels (above center)
-        for i in range(1, half_grid + 1):
-            level = center_price * (1 + (self.grid_spacing_pct / 100) * i)
-            self.sell_levels.append(level)
+        # Buy levels below center, sell levels above; both kept ascending and merged so
+        # _find_bracket can bisect once.
+        self.buy_levels = sorted((center_price * (1 - offsets)).tolist())
+        self.sell_levels = sorted((center_price * (1 + offsets)).tolist())
+        self._grid_levels = self.buy_levels + self.sell_levels
+        self._buy_bands = self._trigger_bands(self.buy_levels)
+        self._sell_bands = self._trigger_bands(self.sell_levels)
 
         # Set bounds
-        self.lower_bound = min(self.buy_levels)
-        self.upper_bound = max(self.sell_levels)
+        self.lower_bound = self.buy_levels[0]
+        self.upper_bound = self.sell_levels[-1]
 
-        logger.info(f"Buy Levels ({len(self.buy_levels)}): ${min(self.buy_levels):,.2f} - ${max(self.buy_levels):,.2f}")
-        logger.info(f"Sell Levels ({len(self.sell_levels)}): ${min(self.sell_levels):,.2f} - ${max(self.sell_levels):,.2f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Buy Levels ({len(self.buy_levels)}): ${self.buy_levels[0]:,.2f} - ${self.buy_levels[-1]:,.2f}")
+            logger.info(f"Sell Levels ({len(self.sell_levels)}): ${self.sell_levels[0]:,.2f} - ${self.sell_levels[-1]:,.2f}")
 
-    def _find_nearest_level(self, price: float, levels: List[float], below: bool) -> Optional[float]:
+    @staticmethod
+    def _trigger_bands(levels: List[float]) -> List[Tuple[float, float]]:
         """
-        Find nearest grid level to current price.
+        Precompute the price band around each level that triggers a signal.
 
         Args:
-            price: Current price
-            levels: List of grid levels
-            below: If True, find nearest level below price; if False, find nearest above
+            levels: Grid levels
 
         Returns:
-            Nearest level or None
+            (low, high) per level; price triggers when strictly inside
         """
-        if not levels:
-            return None
-
-        if below:
-            # Find highest level below price
-            candidates = [l for l in levels if l < price]
-            return max(candidates) if candidates else None
-        else:
-            # Find lowest level above price
-            candidates = [l for l in levels if l > price]
-            return min(candidates) if candidates else None
-
-    def _find_pair_key(self, ticker_data: dict) -> Optional[str]:
-        """Find the actual trading pair key in ticker response."""
-        # Try common variations
-        variations = ['XBTUSD', 'XXBTZUSD', 'BTCUSD', 'ETHUSD', 'XETHZUSD', 'SOLUSD', 'XRPUSD', 'XXRPZUSD']
+        arr = np.asarray(levels, dtype=np.float64)
+        lows = (arr * (1 - TRIGGER_TOLERANCE)).tolist()
+        highs = (arr * (1 + TRIGGER_TOLERANCE)).tolist()
+        return list(zip(lows, highs))
+
+    def _find_bracket(
+        self, price: float
+    ) -> Tuple[Optional[Tuple[int, float]], Optional[Tuple[int, float]]]:
+        """
+        Find the nearest buy level below and the nearest sell level above the price.
 
-        for variation in variations:
-            if variation in ticker_data:
-                return variation
+        One bisect over the merged ascending levels (buys sit below sells) locates both.
 
-        # Return first key if none match
-        if ticker_data:
-            return list(ticker_data.keys())[0]
+        Args:
+            price: Current price
 
-        return None
+        Returns:
+            Tuple of (buy, sell), each (level index, level) or None
+        """
+        levels = self._grid_levels
+        n_buys = len(self.buy_levels)
+        lo = bisect_left(levels, price)
+        hi = lo
+        while hi < len(levels) and levels[hi] == price:
+            hi += 1
+
+        # Highest buy level strictly below price, lowest sell level strictly above it.
+        buy_idx = min(lo, n_buys) - 1
+        sell_idx = max(hi, n_buys) - n_buys
+        nearest_buy = (buy_idx, levels[buy_idx]) if buy_idx >= 0 else None
+        nearest_sell = (sell_idx, levels[n_buys + sell_idx]) if n_buys + sell_idx < len(levels) else None
+        return nearest_buy, nearest_sell
 
     def reset(self) -> None:
         """Reset strategy state."""
@@ -212,7 +238,10 @@ class GridTradingStrategy(TradingStrategy):
         self.grid_center = None
         self.buy_levels = []
         self.sell_levels = []
-        self.filled_buys = set()
-        self.filled_sells = set()
+        self._grid_levels = []
+        self._buy_bands = []
+        self._sell_bands = []
+        self.filled_buy_mask = 0
+        self.filled_sell_mask = 0
         self.upper_bound = None
         self.lower_bound = None
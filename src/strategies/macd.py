@@ -1,9 +1,14 @@
 """MACD Strategy for moderate trending markets."""
 import logging
-from typing import Optional, Dict, Any
+import math
+from typing import Optional, Dict, Any, Tuple
+
+import numpy as np
+
 from .base import TradingStrategy
-from ..indicators import calculate_macd
+from ._kernels import macd_advance, macd_from_state, macd_series
 from ..config_utils import require_bool, require_int
+from ..market_data import has_series, ticker_last_price
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,9 @@ class MACDStrategy(TradingStrategy):
         self.fast_period = require_int(config, 'MACD_FAST')
         self.slow_period = require_int(config, 'MACD_SLOW')
         self.signal_period = require_int(config, 'MACD_SIGNAL')
+        self._strategy_name = f"MACD ({self.fast_period}/{self.slow_period}/{self.signal_period})"
+        # Prices needed before the signal line exists.
+        self._required = self.slow_period + self.signal_period
 
         # Histogram confirmation
         self.require_histogram_confirm = require_bool(config, 'MACD_HISTOGRAM_CONFIRM')
@@ -42,13 +50,17 @@ class MACDStrategy(TradingStrategy):
         self.prev_macd_line = None
         self.prev_signal_line = None
 
-        logger.info(f"MACD Strategy initialized:")
-        logger.info(f"  Fast: {self.fast_period}, Slow: {self.slow_period}, Signal: {self.signal_period}")
-        logger.info(f"  Histogram Confirmation: {self.require_histogram_confirm}")
+        # Running EMA state for the last series analyzed: (source, length, last price, state).
+        # A series that only grew by one price resumes from it; anything else recomputes.
+        self._macd_series = None
+
+        logger.info("MACD Strategy initialized:")
+        logger.info("  Fast: %d, Slow: %d, Signal: %d", self.fast_period, self.slow_period, self.signal_period)
+        logger.info("  Histogram Confirmation: %s", self.require_histogram_confirm)
 
     def get_strategy_name(self) -> str:
         """Return strategy name."""
-        return f"MACD ({self.fast_period}/{self.slow_period}/{self.signal_period})"
+        return self._strategy_name
 
     def analyze(self, market_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -63,49 +75,54 @@ class MACDStrategy(TradingStrategy):
         ohlc = market_data.get('ohlc')
 
         # Prefer committed OHLC close series for indicator correctness.
-        if isinstance(ohlc, dict) and ohlc.get('closes'):
-            prices = list(ohlc['closes'])
+        if has_series(ohlc, 'closes'):
+            prices = ohlc['closes']
             current_price = (
                 float(ohlc['latest']['close'])
                 if isinstance(ohlc.get('latest'), dict) and 'close' in ohlc['latest']
                 else float(prices[-1])
             )
             self.add_price(current_price)
+            source = 'ohlc'
 
-            required = self.slow_period + self.signal_period
+            required = self._required
             if len(prices) < required:
-                logger.info(f"Collecting data... ({len(prices)}/{required})")
+                logger.info("Collecting data... (%d/%d)", len(prices), required)
                 return None
+
+            prices = self._closes_array(prices)
         else:
             # Fallback: Extract current price from ticker
             ticker_data = market_data.get('ticker', {})
-            pair_key = self._find_pair_key(ticker_data)
+            pair_key = self._resolve_pair_key(ticker_data)
 
             if not pair_key:
                 logger.error("Trading pair not found in ticker data")
                 return None
 
-            current_price = float(ticker_data[pair_key]['c'][0])
+            current_price = ticker_last_price(ticker_data[pair_key])
             self.add_price(current_price)
+            source = 'ticker'
 
-            required = self.slow_period + self.signal_period
+            required = self._required
             if not self.has_sufficient_data(required):
-                logger.info(f"Collecting data... ({len(self.price_history)}/{required})")
+                logger.info("Collecting data... (%d/%d)", self._price_len, required)
                 return None
 
-            prices = self.get_prices()
+            prices = self.get_prices_array()
 
-        # Calculate MACD
-        macd_result = calculate_macd(prices, self.fast_period, self.slow_period, self.signal_period)
+        # Calculate MACD (same values as indicators.calculate_macd)
+        macd_line, signal_line, histogram = self._calculate_macd(source, prices)
 
-        if macd_result is None:
+        if math.isnan(macd_line):
             logger.warning("Unable to calculate MACD")
             return None
 
-        macd_line, signal_line, histogram = macd_result
-
         # Log current state
-        logger.info(f"Price: ${current_price:.2f} | MACD: {macd_line:.2f} | Signal: {signal_line:.2f} | Hist: {histogram:.2f}")
+        logger.info(
+            "Price: $%.2f | MACD: %.2f | Signal: %.2f | Hist: %.2f",
+            current_price, macd_line, signal_line, histogram,
+        )
 
         # Detect crossover
         signal = None
@@ -143,7 +160,7 @@ class MACDStrategy(TradingStrategy):
         self.prev_signal_line = signal_line
 
         # Log current trend if no signal
-        if signal is None:
+        if signal is None and logger.isEnabledFor(logging.INFO):
             if macd_line > signal_line:
                 trend = "BULLISH"
                 momentum = "Strong" if histogram > 0 else "Weakening"
@@ -151,27 +168,78 @@ class MACDStrategy(TradingStrategy):
                 trend = "BEARISH"
                 momentum = "Strong" if histogram < 0 else "Weakening"
 
-            logger.info(f"Trend: {trend} ({momentum}) | Position: {self.position or 'None'}")
+            logger.info("Trend: %s (%s) | Position: %s", trend, momentum, self.position or 'None')
 
         return signal
 
-    def _find_pair_key(self, ticker_data: dict) -> Optional[str]:
-        """Find the actual trading pair key in ticker response."""
-        # Try common variations
-        variations = ['XBTUSD', 'XXBTZUSD', 'BTCUSD', 'ETHUSD', 'XETHZUSD', 'SOLUSD', 'XRPUSD', 'XXRPZUSD']
+    def analyze_many(self, prices) -> np.ndarray:
+        """
+        Signals for a whole price series at once, for backtesting.
+
+        Equivalent to feeding each price to a freshly reset strategy through the ticker
+        path of :meth:`analyze` (MACD over the trailing HISTORY_SIZE prices), without
+        touching this instance's state or logging per bar.
+
+        Args:
+            prices: Prices, oldest first
+
+        Returns:
+            int8 array per bar: 1 for 'buy', -1 for 'sell', 0 for no signal
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        signals = np.zeros(prices.shape[0], dtype=np.int8)
+        if prices.shape[0] < 2:
+            return signals
+
+        macd_line, signal_line = macd_series(
+            prices, self.price_history.maxlen, self.fast_period, self.slow_period, self.signal_period
+        )
+        histogram = macd_line - signal_line
+
+        # Crossovers against the previous bar; NaN (insufficient data) never compares true.
+        prev_macd, prev_signal = macd_line[:-1], signal_line[:-1]
+        macd_now, signal_now, hist_now = macd_line[1:], signal_line[1:], histogram[1:]
+        bullish = (prev_macd <= prev_signal) & (macd_now > signal_now)
+        bearish = (prev_macd >= prev_signal) & (macd_now < signal_now)
+        if self.require_histogram_confirm:
+            bullish &= hist_now > 0
+            bearish &= hist_now < 0
+
+        signals[1:][bullish] = 1
+        signals[1:][bearish] = -1
+        return signals
+
+    def _calculate_macd(self, source: str, prices: np.ndarray) -> Tuple[float, float, float]:
+        """
+        MACD for a price series, reusing the running EMAs when possible.
 
-        for variation in variations:
-            if variation in ticker_data:
-                return variation
+        When ``prices`` is the previously analyzed series plus one new price, only that
+        price is fed through the EMAs. A full history window slides instead of growing,
+        and the window-seeded EMAs cannot be updated in place, so those ticks walk the
+        whole series again.
 
-        # Return first key if none match
-        if ticker_data:
-            return list(ticker_data.keys())[0]
+        Args:
+            source: 'ohlc' or 'ticker', so the two series never resume from each other
+            prices: Price series, most recent last
+
+        Returns:
+            Tuple of (macd_line, signal_line, histogram); all NaN on insufficient data
+        """
+        fast, slow, signal = self.fast_period, self.slow_period, self.signal_period
+        length = len(prices)
+        previous = self._macd_series
+        if (previous is not None and previous[0] == source and previous[1] == length - 1
+                and prices[-2] == previous[2]):
+            state = macd_advance(prices[-1:], length - 1, *previous[3], fast, slow, signal)
+        else:
+            state = macd_advance(prices, 0, 0.0, 0.0, 0.0, 0, fast, slow, signal)
 
-        return None
+        self._macd_series = (source, length, float(prices[-1]), state)
+        return macd_from_state(length, state, fast, slow, signal)
 
     def reset(self) -> None:
         """Reset strategy state."""
         super().reset()
         self.prev_macd_line = None
         self.prev_signal_line = None
+        self._macd_series = None
@@ -1,11 +1,15 @@
 """Mean Reversion Range Trading Strategy."""
 import logging
-from typing import Optional, Dict, Any
+import math
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Sequence, Tuple
 from .base import TradingStrategy
+from ._kernels import rsi_bollinger_kernel
 from ..config_utils import optional, require_bool, require_float, require_int
+from ..market_data import has_series, ticker_last_price
 from ..indicators import (
-    calculate_rsi,
-    calculate_bollinger_bands,
     detect_support_resistance,
     find_swing_high_low,
     calculate_fibonacci_retracement,
@@ -14,6 +18,38 @@ from ..indicators import (
 
 logger = logging.getLogger(__name__)
 
+# (support, resistance, breakout_lower, breakout_upper) defaults by symbol, based on
+# typical price ranges.
+_COIN_DEFAULTS = {
+    'XBTUSD': (94000, 102000, 93000, 106000),
+    'ETHUSD': (3000, 3300, 2900, 3400),
+    'SOLUSD': (130, 150, 120, 160),
+    'XRPUSD': (2.15, 2.35, 2.05, 2.45),
+}
+# Without a symbol the strategy has always assumed BTC.
+_NO_SYMBOL_DEFAULTS = _COIN_DEFAULTS['XBTUSD']
+# For unknown symbols (e.g. PEPE/DOGE/ARB), avoid BTC-sized defaults.
+# These get initialized from price history when AUTO_DETECT_LEVELS=true.
+_UNKNOWN_SYMBOL_DEFAULTS = (0.0, 0.0, 0.0, float('inf'))
+
+
+@lru_cache(maxsize=32)
+def _fib_retracement(swing_high: float, swing_low: float) -> Mapping[str, float]:
+    """
+    Fibonacci retracement levels for a swing pair, memoized and read-only.
+
+    Keyed on the exact swing prices (rounding would merge distinct swings of
+    low-priced coins); ticks inside an unchanged swing window reuse the levels.
+
+    Args:
+        swing_high: Recent swing high price
+        swing_low: Recent swing low price
+
+    Returns:
+        Read-only mapping of Fibonacci retracement levels
+    """
+    return MappingProxyType(calculate_fibonacci_retracement(swing_high, swing_low))
+
 
 class MeanReversionStrategy(TradingStrategy):
     """
@@ -75,6 +111,7 @@ class MeanReversionStrategy(TradingStrategy):
         if resistance_zone_raw is None:
             resistance_zone_raw = optional(config, 'RESISTANCE_ZONE')
         self.resistance_zone = float(resistance_zone_raw) if resistance_zone_raw is not None else float(self.resistance_level * 0.03)
+        self._refresh_zone_bounds()
 
         # Breakout detection - USE PER-COIN CONFIG
         breakout_lower_raw = optional(config, f'{prefix}BREAKOUT_LOWER')
@@ -102,6 +139,22 @@ class MeanReversionStrategy(TradingStrategy):
         self.min_profit_target = float(min_profit_raw)
         self.entry_price = None  # Track entry price for profit calculation
 
+        # Rolling RSI/Bollinger state over price_history (see add_price()): the last
+        # rsi_period changes and bb_period prices, with running sums updated as samples
+        # enter and leave. Band sums are taken relative to _bb_shift to avoid cancellation.
+        self._rsi_changes: deque = deque(maxlen=self.rsi_period)
+        self._bb_window: deque = deque(maxlen=self.bb_period)
+        self._reset_rolling()
+
+        # Committed candle (time, series length, close) the detected support/resistance
+        # levels and Fibonacci swing were last derived for; polls on the same candle reuse them.
+        self._levels_key = None
+        self._detected_levels = None  # (support_levels, resistance_levels) or None
+        self._fib = None  # (swing_high, swing_low, fib_levels) or None
+        # Inputs and state of the last committed-candle poll that returned None without
+        # touching any state; an identical poll would do the same, so it is skipped.
+        self._idle_poll_key = None
+
         logger.info(f"Mean Reversion Strategy initialized for {symbol or 'default'}:")
         logger.info(f"  RSI: {self.rsi_period} period, oversold < {self.rsi_oversold}, overbought > {self.rsi_overbought}")
         logger.info(f"  Bollinger Bands: {self.bb_period} period, {self.bb_std_dev} std dev")
@@ -119,26 +172,15 @@ class MeanReversionStrategy(TradingStrategy):
             (support, resistance, breakout_lower, breakout_upper)
         """
         if not symbol:
-            return (94000, 102000, 93000, 106000)
-
-        # Coin-specific defaults based on typical price ranges
-        defaults = {
-            'XBTUSD': (94000, 102000, 93000, 106000),
-            'ETHUSD': (3000, 3300, 2900, 3400),
-            'SOLUSD': (130, 150, 120, 160),
-            'XRPUSD': (2.15, 2.35, 2.05, 2.45),
-        }
+            return _NO_SYMBOL_DEFAULTS
+        return _COIN_DEFAULTS.get(symbol, _UNKNOWN_SYMBOL_DEFAULTS)
 
-        # For unknown symbols (e.g. PEPE/DOGE/ARB), avoid BTC-sized defaults.
-        # These get initialized from price history when AUTO_DETECT_LEVELS=true.
-        return defaults.get(symbol, (0.0, 0.0, 0.0, float('inf')))
-
-    def _ensure_levels_initialized(self, prices: list, current_price: float) -> None:
+    def _ensure_levels_initialized(self, prices: Sequence[float], current_price: float) -> None:
         """Seed support/resistance/breakout levels from recent prices.
 
         This keeps the strategy usable for low-priced assets when relying on auto-detection.
         """
-        if not prices or current_price <= 0:
+        if len(prices) == 0 or current_price <= 0:
             return
 
         # If levels already look sane and ordered, keep them.
@@ -159,20 +201,124 @@ class MeanReversionStrategy(TradingStrategy):
             self.support_zone = self.support_level * 0.03
         if not self.resistance_zone or self.resistance_zone <= 0:
             self.resistance_zone = self.resistance_level * 0.03
+        self._refresh_zone_bounds()
 
         # Breakout bounds: a bit wider than range.
         self.breakout_lower = self.support_level * 0.97
         self.breakout_upper = self.resistance_level * 1.03
 
         logger.info(
-            f"📊 Auto-level init ({self.symbol or 'default'}): support={self.support_level:g}, "
-            f"resistance={self.resistance_level:g}, breakout=[{self.breakout_lower:g}, {self.breakout_upper:g}]"
+            "📊 Auto-level init (%s): support=%g, resistance=%g, breakout=[%g, %g]",
+            self.symbol or 'default', self.support_level, self.resistance_level,
+            self.breakout_lower, self.breakout_upper,
         )
 
+    def _refresh_zone_bounds(self) -> None:
+        """Recompute the support/resistance zone bounds; call whenever a level or zone changes."""
+        self._support_lo = self.support_level - self.support_zone
+        self._support_hi = self.support_level + self.support_zone
+        self._resistance_lo = self.resistance_level - self.resistance_zone
+        self._resistance_hi = self.resistance_level + self.resistance_zone
+
     def get_strategy_name(self) -> str:
         """Return strategy name."""
         return "Mean Reversion Range Trading"
 
+    def add_price(self, price: float) -> None:
+        """Add a price to the history and roll the RSI/Bollinger sums forward."""
+        history = self.price_history
+        if history:
+            change = price - history[-1]
+            changes = self._rsi_changes
+            if len(changes) == changes.maxlen:
+                self._roll_change(changes[0], -1)
+            changes.append(change)
+            self._roll_change(change, 1)
+
+        window = self._bb_window
+        if len(window) == window.maxlen:
+            old = window[0] - self._bb_shift
+            self._bb_sum -= old
+            self._bb_sum_sq -= old * old
+        window.append(price)
+        new = price - self._bb_shift
+        self._bb_sum += new
+        self._bb_sum_sq += new * new
+
+        super().add_price(price)
+
+        # Re-derive the sums every HISTORY_SIZE prices so rounding errors cannot build up.
+        self._roll_ticks += 1
+        if self._roll_ticks >= (history.maxlen or 1):
+            self._resync_rolling()
+
+    def _roll_change(self, change: float, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one price change from the RSI sums."""
+        if change > 0:
+            self._rsi_gain_count += sign
+            self._rsi_gain_sum = self._rsi_gain_sum + sign * change if self._rsi_gain_count else 0.0
+        elif change < 0:
+            self._rsi_loss_count += sign
+            self._rsi_loss_sum = self._rsi_loss_sum - sign * change if self._rsi_loss_count else 0.0
+
+    def _resync_rolling(self) -> None:
+        """Recompute the rolling sums exactly from the windows."""
+        changes = self._rsi_changes
+        self._rsi_gain_sum = sum(c for c in changes if c > 0) + 0.0
+        self._rsi_loss_sum = -sum(c for c in changes if c < 0) + 0.0
+        self._rsi_gain_count = sum(1 for c in changes if c > 0)
+        self._rsi_loss_count = sum(1 for c in changes if c < 0)
+
+        window = self._bb_window
+        self._bb_shift = window[-1] if window else 0.0
+        deviations = [p - self._bb_shift for p in window]
+        self._bb_sum = sum(deviations) + 0.0
+        self._bb_sum_sq = sum(d * d for d in deviations) + 0.0
+        self._roll_ticks = 0
+
+    def _reset_rolling(self) -> None:
+        """Clear the rolling RSI/Bollinger state."""
+        self._rsi_changes.clear()
+        self._bb_window.clear()
+        self._rsi_gain_sum = self._rsi_loss_sum = 0.0
+        self._rsi_gain_count = self._rsi_loss_count = 0
+        self._bb_shift = self._bb_sum = self._bb_sum_sq = 0.0
+        self._roll_ticks = 0
+
+    def _rolling_rsi_bollinger(self) -> Tuple[float, float, float, float]:
+        """
+        RSI and Bollinger Bands of price_history from the rolling sums, in O(1).
+
+        Matches rsi_bollinger_kernel on the price history up to rounding.
+
+        Returns:
+            Tuple of (rsi, upper_band, middle_band, lower_band); NaN where the windows
+            are not yet full
+        """
+        rsi = math.nan
+        if len(self._rsi_changes) == self.rsi_period:
+            avg_gain = self._rsi_gain_sum / self.rsi_period
+            avg_loss = self._rsi_loss_sum / self.rsi_period
+            rsi = 100.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+
+        n = self.bb_period
+        if len(self._bb_window) < n:
+            return rsi, math.nan, math.nan, math.nan
+        mean_offset = self._bb_sum / n
+        middle = self._bb_shift + mean_offset
+        std = max(self._bb_sum_sq / n - mean_offset * mean_offset, 0.0) ** 0.5
+        return rsi, middle + self.bb_std_dev * std, middle, middle - self.bb_std_dev * std
+
+    def reset(self) -> None:
+        """Reset strategy state."""
+        super().reset()
+        self.entry_price = None
+        self._reset_rolling()
+        self._levels_key = None
+        self._detected_levels = None
+        self._fib = None
+        self._idle_poll_key = None
+
     def analyze(self, market_data: Dict[str, Any]) -> Optional[str]:
         """
         Analyze market data for mean reversion signals.
@@ -186,96 +332,136 @@ class MeanReversionStrategy(TradingStrategy):
         ohlc = market_data.get('ohlc')
 
         # Prefer committed OHLC close series for indicator correctness.
-        if isinstance(ohlc, dict) and ohlc.get('closes'):
-            prices = list(ohlc['closes'])
+        if has_series(ohlc, 'closes'):
+            prices = ohlc['closes']
+            latest = ohlc.get('latest')
             current_price = (
-                float(ohlc['latest']['close'])
-                if isinstance(ohlc.get('latest'), dict) and 'close' in ohlc['latest']
+                float(latest['close'])
+                if isinstance(latest, dict) and 'close' in latest
                 else float(prices[-1])
             )
             self.add_price(current_price)
+            levels_key = (latest.get('time'), len(prices), prices[-1]) if isinstance(latest, dict) else None
+
+            # Until the next candle commits, polls see the same closes and price.
+            poll_key = None
+            if levels_key is not None:
+                poll_key = (levels_key, current_price, self.position, self.entry_price, self._level_state())
+                if poll_key == self._idle_poll_key:
+                    return None
+            self._idle_poll_key = None
 
             required_periods = max(self.rsi_period, self.bb_period)
             if len(prices) < required_periods + 1:
-                logger.info(f"Collecting data... ({len(prices)}/{required_periods + 1})")
+                logger.info("Collecting data... (%d/%d)", len(prices), required_periods + 1)
                 return None
+
+            # Committed candles can be revised, so the whole window is evaluated.
+            rsi, upper_bb, middle_bb, lower_bb, swing_high, swing_low = rsi_bollinger_kernel(
+                self._closes_array(prices), self.rsi_period, self.bb_period, self.bb_std_dev,
+                self.fib_lookback_period,
+            )
+            swing_points = None if math.isnan(swing_high) else (swing_high, swing_low)
         else:
+            self._idle_poll_key = None
+
             # Extract current price from ticker
             ticker_data = market_data.get('ticker', {})
 
-            pair_key = self._find_pair_key(ticker_data)
+            pair_key = self._resolve_pair_key(ticker_data)
             if not pair_key:
                 logger.error("Trading pair not found in ticker data")
                 return None
 
-            current_price = float(ticker_data[pair_key]['c'][0])
+            current_price = ticker_last_price(ticker_data[pair_key])
             self.add_price(current_price)
 
             required_periods = max(self.rsi_period, self.bb_period)
             if not self.has_sufficient_data(required_periods + 1):
-                logger.info(f"Collecting data... ({len(self.price_history)}/{required_periods + 1})")
+                logger.info("Collecting data... (%d/%d)", self._price_len, required_periods + 1)
                 return None
 
-            prices = self.get_prices()
-
-        # Calculate indicators
-        rsi = calculate_rsi(prices, self.rsi_period)
-        bb = calculate_bollinger_bands(prices, self.bb_period, self.bb_std_dev)
+            prices = self.get_prices_array()
+            levels_key = None  # the series moves every tick
+            poll_key = None
+            # The history only ever grows at the end, so the rolling sums apply.
+            rsi, upper_bb, middle_bb, lower_bb = self._rolling_rsi_bollinger()
+            swing_points = None
 
-        if rsi is None or bb is None:
+        if math.isnan(rsi) or math.isnan(middle_bb):
             logger.warning("Unable to calculate indicators")
             return None
 
-        upper_bb, middle_bb, lower_bb = bb
+        # Thousands separators have no %-style equivalent, so per-tick lines that use
+        # them are guarded instead.
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        # Detected levels and swing points depend only on the close series, so they are
+        # recomputed once per committed candle rather than on every poll.
+        refresh_levels = levels_key is None or levels_key != self._levels_key
+        self._levels_key = levels_key
+
+        if refresh_levels:
+            self._detected_levels = None
+            if self.auto_detect_levels and len(prices) >= 50:
+                self._detected_levels = detect_support_resistance(prices, window=10, threshold=0.02)
+
+            self._fib = None
+            if self.use_fibonacci and len(prices) >= self.fib_lookback_period:
+                if swing_points is None:
+                    swing_points = find_swing_high_low(prices, self.fib_lookback_period)
+                if swing_points:
+                    swing_high, swing_low = swing_points
+                    self._fib = (swing_high, swing_low, _fib_retracement(swing_high, swing_low))
 
         # If we're relying on auto levels, ensure we start with sane bounds before breakout checks.
         if self.auto_detect_levels and len(prices) >= 20:
             self._ensure_levels_initialized(prices, current_price)
 
         # Update support/resistance if auto-detection enabled
-        if self.auto_detect_levels and len(prices) >= 50:
-            self._update_support_resistance(prices)
+        if self._detected_levels is not None:
+            self._update_support_resistance(*self._detected_levels)
 
-        # Calculate Fibonacci levels if enabled
+        # Calculate Fibonacci signal strength if enabled
         fib_strength = 1.0  # Default: no Fibonacci bonus
         fib_levels = None
-        if self.use_fibonacci and len(prices) >= self.fib_lookback_period:
-            swing_points = find_swing_high_low(prices, self.fib_lookback_period)
-            if swing_points:
-                swing_high, swing_low = swing_points
-                fib_levels = calculate_fibonacci_retracement(swing_high, swing_low)
-                fib_strength = get_fibonacci_signal_strength(
-                    current_price,
-                    fib_levels,
-                    key_levels=['38.2%', '50.0%', '61.8%'],
-                    tolerance_percent=self.fib_tolerance
-                )
-
-                # Log Fibonacci analysis
-                if fib_strength > 1.0:
-                    logger.info(f"📐 Fibonacci: Near key level (strength: {fib_strength:.2f}x)")
-                    logger.info(f"   Swing: ${swing_low:,.2f} - ${swing_high:,.2f}")
-                    logger.info(f"   61.8%: ${fib_levels['61.8%']:,.2f} | 50.0%: ${fib_levels['50.0%']:,.2f} | 38.2%: ${fib_levels['38.2%']:,.2f}")
+        if self._fib is not None:
+            swing_high, swing_low, fib_levels = self._fib
+            fib_strength = get_fibonacci_signal_strength(
+                current_price,
+                fib_levels,
+                key_levels=['38.2%', '50.0%', '61.8%'],
+                tolerance_percent=self.fib_tolerance
+            )
+
+            # Log Fibonacci analysis
+            if fib_strength > 1.0 and log_info:
+                logger.info("📐 Fibonacci: Near key level (strength: %.2fx)", fib_strength)
+                logger.info(f"   Swing: ${swing_low:,.2f} - ${swing_high:,.2f}")
+                logger.info(f"   61.8%: ${fib_levels['61.8%']:,.2f} | 50.0%: ${fib_levels['50.0%']:,.2f} | 38.2%: ${fib_levels['38.2%']:,.2f}")
 
         # Check for range breakout (exit condition)
         if current_price < self.breakout_lower:
-            logger.warning(f"⚠️ BREAKOUT BELOW ${self.breakout_lower:,.0f}! Price: ${current_price:,.2f}")
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"⚠️ BREAKOUT BELOW ${self.breakout_lower:,.0f}! Price: ${current_price:,.2f}")
             logger.warning("Range broken - consider switching to trend-following strategy")
+            self._remember_idle_poll(poll_key)
             return None
 
         if current_price > self.breakout_upper:
-            logger.warning(f"⚠️ BREAKOUT ABOVE ${self.breakout_upper:,.0f}! Price: ${current_price:,.2f}")
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"⚠️ BREAKOUT ABOVE ${self.breakout_upper:,.0f}! Price: ${current_price:,.2f}")
             logger.warning("Range broken - consider switching to trend-following strategy")
+            self._remember_idle_poll(poll_key)
             return None
 
         # Determine position in range
-        in_support_zone = (self.support_level - self.support_zone <= current_price <=
-                          self.support_level + self.support_zone)
-        in_resistance_zone = (self.resistance_level - self.resistance_zone <= current_price <=
-                             self.resistance_level + self.resistance_zone)
+        in_support_zone = self._support_lo <= current_price <= self._support_hi
+        in_resistance_zone = self._resistance_lo <= current_price <= self._resistance_hi
 
         # Log current state
-        logger.info(f"Price: ${current_price:,.2f} | RSI: {rsi:.1f} | BB: ${lower_bb:,.2f} - ${middle_bb:,.2f} - ${upper_bb:,.2f}")
+        if log_info:
+            logger.info(f"Price: ${current_price:,.2f} | RSI: {rsi:.1f} | BB: ${lower_bb:,.2f} - ${middle_bb:,.2f} - ${upper_bb:,.2f}")
 
         # BUY Signal: Near support, oversold, below lower BB
         # Fibonacci enhancement: Relax RSI requirement if near key Fib level
@@ -324,9 +510,11 @@ class MeanReversionStrategy(TradingStrategy):
                 profit_pct = (current_price - self.entry_price) / self.entry_price
 
                 if profit_pct < self.min_profit_target:
-                    logger.debug(f"⚠️ SELL conditions met but profit too low:")
-                    logger.debug(f"  Current profit: {profit_pct*100:.2f}% < Target: {self.min_profit_target*100:.2f}%")
-                    logger.debug(f"  Entry: ${self.entry_price:,.2f} → Current: ${current_price:,.2f}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("⚠️ SELL conditions met but profit too low:")
+                        logger.debug("  Current profit: %.2f%% < Target: %.2f%%", profit_pct * 100, self.min_profit_target * 100)
+                        logger.debug(f"  Entry: ${self.entry_price:,.2f} → Current: ${current_price:,.2f}")
+                    self._remember_idle_poll(poll_key)
                     return None  # Don't sell yet
 
             signal_confidence = "HIGH" if fib_strength > 1.15 else "MEDIUM"
@@ -347,14 +535,33 @@ class MeanReversionStrategy(TradingStrategy):
             return 'sell'
 
         # Log current market state
-        zone = "SUPPORT ZONE" if in_support_zone else "RESISTANCE ZONE" if in_resistance_zone else "MID-RANGE"
-        rsi_state = "Oversold" if rsi < self.rsi_oversold else "Overbought" if rsi > self.rsi_overbought else "Neutral"
-        bb_state = "Below" if current_price < lower_bb else "Above" if current_price > upper_bb else "Within"
-
-        logger.info(f"Status: {zone} | RSI: {rsi_state} | BB: {bb_state} | Position: {self.position or 'None'}")
+        if log_info:
+            zone = "SUPPORT ZONE" if in_support_zone else "RESISTANCE ZONE" if in_resistance_zone else "MID-RANGE"
+            rsi_state = "Oversold" if rsi < self.rsi_oversold else "Overbought" if rsi > self.rsi_overbought else "Neutral"
+            bb_state = "Below" if current_price < lower_bb else "Above" if current_price > upper_bb else "Within"
+            logger.info("Status: %s | RSI: %s | BB: %s | Position: %s", zone, rsi_state, bb_state, self.position or 'None')
 
+        self._remember_idle_poll(poll_key)
         return None
 
+    def _level_state(self) -> Tuple[float, ...]:
+        """Snapshot of the range levels a poll may move."""
+        return (self.support_level, self.resistance_level, self.support_zone,
+                self.resistance_zone, self.breakout_lower, self.breakout_upper)
+
+    def _remember_idle_poll(self, poll_key: Optional[tuple]) -> None:
+        """
+        Record a poll that returned None so an identical follow-up can be skipped.
+
+        Only polls that left the range levels as they found them qualify; otherwise the
+        next poll starts from different state and must run in full.
+
+        Args:
+            poll_key: Key built at the start of the poll, or None on the ticker path
+        """
+        if poll_key is not None and poll_key[-1] == self._level_state():
+            self._idle_poll_key = poll_key
+
     def _find_pair_key(self, ticker_data: dict) -> Optional[str]:
         """
         Find the actual trading pair key in ticker response.
@@ -365,38 +572,31 @@ class MeanReversionStrategy(TradingStrategy):
         Returns:
             Pair key or None
         """
-        # Prefer the configured symbol, otherwise use the only returned key.
+        # Prefer the configured symbol, otherwise use the only (or first) returned key.
         if self.symbol and self.symbol in ticker_data:
             return self.symbol
 
-        if isinstance(ticker_data, dict) and len(ticker_data) == 1:
-            return next(iter(ticker_data.keys()))
+        return next(iter(ticker_data), None)
 
-        # Return first key if none match
-        if ticker_data:
-            return next(iter(ticker_data.keys()))
-
-        return None
-
-    def _update_support_resistance(self, prices: list) -> None:
+    def _update_support_resistance(self, support_levels: List[float], resistance_levels: List[float]) -> None:
         """
         Dynamically update support and resistance levels.
 
         Args:
-            prices: Price history
+            support_levels: Support levels detected in the price history
+            resistance_levels: Resistance levels detected in the price history
         """
-        support_levels, resistance_levels = detect_support_resistance(prices, window=10, threshold=0.02)
 
         if support_levels:
             # Use the highest support level (closest to current price)
             new_support = max(support_levels)
             if self.support_level <= 0:
                 self.support_level = new_support
-                logger.info(f"📊 Support level initialized: {new_support:g}")
+                logger.info("📊 Support level initialized: %g", new_support)
             else:
                 rel = abs(new_support - self.support_level) / max(self.support_level, 1e-12)
                 if rel >= 0.01:
-                    logger.info(f"📊 Support level updated: {self.support_level:g} → {new_support:g}")
+                    logger.info("📊 Support level updated: %g → %g", self.support_level, new_support)
                     self.support_level = new_support
 
         if resistance_levels:
@@ -404,13 +604,15 @@ class MeanReversionStrategy(TradingStrategy):
             new_resistance = min(resistance_levels)
             if self.resistance_level <= 0:
                 self.resistance_level = new_resistance
-                logger.info(f"📊 Resistance level initialized: {new_resistance:g}")
+                logger.info("📊 Resistance level initialized: %g", new_resistance)
             else:
                 rel = abs(new_resistance - self.resistance_level) / max(self.resistance_level, 1e-12)
                 if rel >= 0.01:
-                    logger.info(f"📊 Resistance level updated: {self.resistance_level:g} → {new_resistance:g}")
+                    logger.info("📊 Resistance level updated: %g → %g", self.resistance_level, new_resistance)
                     self.resistance_level = new_resistance
 
+        self._refresh_zone_bounds()
+
         # Keep breakout bounds loosely aligned with the detected range.
         if self.support_level > 0 and self.resistance_level > 0 and self.support_level < self.resistance_level:
             self.breakout_lower = self.support_level * 0.97
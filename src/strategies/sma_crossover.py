@@ -1,13 +1,19 @@
 """SMA Crossover Strategy."""
 import logging
 import time
-from typing import Optional, Dict, Any
+from collections import deque
+from typing import Optional, Dict, Any, Tuple
 from .base import TradingStrategy
-from ..indicators import calculate_sma
+from ..indicators import calculate_sma, sum_in_order
 from ..config_utils import require_bool, require_float, require_int
+from ..market_data import as_float_list, has_series, ticker_last_price
 
 logger = logging.getLogger(__name__)
 
+# Running sums drift from calculate_sma by a few ulps; when the SMAs are closer than
+# this (relative) the exact values decide the crossover, so ties are never invented.
+_ROLLING_TIE_TOLERANCE = 1e-9
+
 
 class SMACrossoverStrategy(TradingStrategy):
     """
@@ -36,15 +42,20 @@ class SMACrossoverStrategy(TradingStrategy):
 
         self.fast_period = require_int(config, 'FAST_SMA_PERIOD')
         self.slow_period = require_int(config, 'SLOW_SMA_PERIOD')
+        self._strategy_name = f"SMA Crossover (Fast: {self.fast_period}, Slow: {self.slow_period})"
+
+        # For crossover detection: fast SMA minus slow SMA on the previous tick
+        self.prev_sma_diff = None
 
-        # For crossover detection
-        self.prev_fast_sma = None
-        self.prev_slow_sma = None
+        # Running sums over the last fast/slow prices of price_history
+        self._fast_window: deque = deque(maxlen=self.fast_period)
+        self._slow_window: deque = deque(maxlen=self.slow_period)
+        self._reset_rolling()
 
         # Profit target checking
         self.min_profit_target = require_float(config, 'MIN_PROFIT_TARGET')
         self.entry_price = None
-        self.entry_time = None
+        self.entry_time = None  # time.monotonic() at entry
 
         # Minimum hold time (seconds) to prevent whipsaws
         self.min_hold_time = require_int(config, 'MIN_HOLD_TIME')
@@ -60,7 +71,59 @@ class SMACrossoverStrategy(TradingStrategy):
 
     def get_strategy_name(self) -> str:
         """Return strategy name."""
-        return f"SMA Crossover (Fast: {self.fast_period}, Slow: {self.slow_period})"
+        return self._strategy_name
+
+    def add_price(self, price: float) -> None:
+        """Add a price to the history and roll the SMA sums forward."""
+        fast_window = self._fast_window
+        if len(fast_window) == fast_window.maxlen:
+            self._fast_sum -= fast_window[0]
+        fast_window.append(price)
+        self._fast_sum += price
+
+        slow_window = self._slow_window
+        if len(slow_window) == slow_window.maxlen:
+            self._slow_sum -= slow_window[0]
+        slow_window.append(price)
+        self._slow_sum += price
+
+        super().add_price(price)
+
+        # Re-derive the sums every HISTORY_SIZE prices so rounding errors cannot build up.
+        self._roll_ticks += 1
+        if self._roll_ticks >= (self.price_history.maxlen or 1):
+            self._resync_rolling()
+
+    def _resync_rolling(self) -> None:
+        """Recompute the SMA sums from the windows, summed as calculate_sma sums them."""
+        self._fast_sum = sum_in_order(self._fast_window)
+        self._slow_sum = sum_in_order(self._slow_window)
+        self._roll_ticks = 0
+
+    def _reset_rolling(self) -> None:
+        """Clear the rolling SMA state."""
+        self._fast_window.clear()
+        self._slow_window.clear()
+        self._fast_sum = self._slow_sum = 0.0
+        self._roll_ticks = 0
+
+    def _rolling_smas(self) -> Tuple[float, float]:
+        """
+        Fast and slow SMA of price_history from the running sums, in O(1).
+
+        Falls back to calculate_sma when the two are within rounding of each other, so
+        the crossover comparisons see the same order (and ties) as the exact values.
+
+        Returns:
+            Tuple of (fast_sma, slow_sma); call only once the slow window is full
+        """
+        fast_sma = self._fast_sum / self.fast_period
+        slow_sma = self._slow_sum / self.slow_period
+        if abs(fast_sma - slow_sma) <= _ROLLING_TIE_TOLERANCE * abs(slow_sma):
+            prices = self.get_prices()
+            fast_sma = calculate_sma(prices, self.fast_period)
+            slow_sma = calculate_sma(prices, self.slow_period)
+        return fast_sma, slow_sma
 
     def analyze(self, market_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -75,59 +138,66 @@ class SMACrossoverStrategy(TradingStrategy):
         ohlc = market_data.get('ohlc')
 
         # Prefer committed OHLC close series for indicator correctness.
-        if isinstance(ohlc, dict) and ohlc.get('closes'):
-            prices = list(ohlc['closes'])
+        if has_series(ohlc, 'closes'):
+            closes = ohlc['closes']
             current_price = (
                 float(ohlc['latest']['close'])
                 if isinstance(ohlc.get('latest'), dict) and 'close' in ohlc['latest']
-                else float(prices[-1])
+                else float(closes[-1])
             )
             self.add_price(current_price)
 
-            if len(prices) < self.slow_period:
-                logger.info(f"Collecting data... ({len(prices)}/{self.slow_period})")
+            if len(closes) < self.slow_period:
+                logger.info("Collecting data... (%d/%d)", len(closes), self.slow_period)
                 return None
+
+            # Committed candles can be revised, so the windows are summed afresh; only
+            # the tail they cover is converted.
+            tail = as_float_list(closes[-max(self.fast_period, self.slow_period):])
+            fast_sma = calculate_sma(tail, self.fast_period)
+            slow_sma = calculate_sma(tail, self.slow_period)
         else:
             # Extract current price from ticker
             ticker_data = market_data.get('ticker', {})
 
             # Find the actual pair key
-            pair_key = self._find_pair_key(ticker_data)
+            pair_key = self._resolve_pair_key(ticker_data)
             if not pair_key:
                 logger.error("Trading pair not found in ticker data")
                 return None
 
-            current_price = float(ticker_data[pair_key]['c'][0])
+            current_price = ticker_last_price(ticker_data[pair_key])
             self.add_price(current_price)
 
             if not self.has_sufficient_data(self.slow_period):
-                logger.info(f"Collecting data... ({len(self.price_history)}/{self.slow_period})")
+                logger.info("Collecting data... (%d/%d)", self._price_len, self.slow_period)
                 return None
 
-            prices = self.get_prices()
-
-        # Calculate current SMAs
-        fast_sma = calculate_sma(prices, self.fast_period)
-        slow_sma = calculate_sma(prices, self.slow_period)
+            # The history only ever grows at the end, so the running sums apply.
+            fast_sma, slow_sma = self._rolling_smas()
 
         if fast_sma is None or slow_sma is None:
             logger.warning("Unable to calculate SMAs")
             return None
 
         # Log current state
-        logger.info(f"Price: ${current_price:.2f} | Fast SMA: ${fast_sma:.2f} | Slow SMA: ${slow_sma:.2f}")
+        logger.info("Price: $%.2f | Fast SMA: $%.2f | Slow SMA: $%.2f", current_price, fast_sma, slow_sma)
 
-        # Detect crossover
+        # Detect crossover. For finite floats the difference has the sign of the
+        # comparison (and is zero only on a tie), so one subtraction replaces both.
+        sma_diff = fast_sma - slow_sma
+        now = time.monotonic()  # hold times must not jump with the wall clock
+        prev_diff = self.prev_sma_diff
         signal = None
-        if self.prev_fast_sma is not None and self.prev_slow_sma is not None:
+        if prev_diff is not None:
             # Bullish crossover: fast crosses above slow
-            if self.prev_fast_sma <= self.prev_slow_sma and fast_sma > slow_sma:
+            if prev_diff <= 0.0 < sma_diff:
                 logger.info("🟢 BULLISH CROSSOVER DETECTED!")
 
                 # TREND ALIGNMENT CHECK - Don't buy in downtrends
                 if self.enable_trend_filter and self.market_state:
                     if 'downtrend' in self.market_state.lower():
-                        logger.info(f"⚠️ BUY signal ignored - market in {self.market_state}")
+                        logger.info("⚠️ BUY signal ignored - market in %s", self.market_state)
                         logger.info("  Trend filter: Won't go LONG during downtrend")
                         signal = None
                     else:
@@ -136,7 +206,7 @@ class SMACrossoverStrategy(TradingStrategy):
                     signal = 'buy'
 
             # Bearish crossover: fast crosses below slow
-            elif self.prev_fast_sma >= self.prev_slow_sma and fast_sma < slow_sma:
+            elif sma_diff < 0.0 <= prev_diff:
                 logger.info("🔴 BEARISH CROSSOVER DETECTED!")
 
                 # Initialize potential signal
@@ -146,7 +216,7 @@ class SMACrossoverStrategy(TradingStrategy):
                 # Only sell if we have a position (spot trading - can't short)
                 if self.enable_trend_filter and self.market_state:
                     if 'uptrend' in self.market_state.lower() and self.position != 'long':
-                        logger.info(f"⚠️ SELL signal ignored - market in {self.market_state} with no long position")
+                        logger.info("⚠️ SELL signal ignored - market in %s with no long position", self.market_state)
                         logger.info("  Trend filter: Won't sell/short during uptrend without existing position")
                         signal = None
 
@@ -155,75 +225,53 @@ class SMACrossoverStrategy(TradingStrategy):
                     profit_pct = (current_price - self.entry_price) / self.entry_price
 
                     if profit_pct < self.min_profit_target:
-                        logger.debug(f"⚠️ SELL signal ignored - profit too low:")
-                        logger.debug(f"  Current profit: {profit_pct*100:.2f}% < Target: {self.min_profit_target*100:.2f}%")
-                        logger.debug(f"  Entry: ${self.entry_price:,.2f} → Current: ${current_price:,.2f}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("⚠️ SELL signal ignored - profit too low:")
+                            logger.debug("  Current profit: %.2f%% < Target: %.2f%%", profit_pct * 100, self.min_profit_target * 100)
+                            logger.debug(f"  Entry: ${self.entry_price:,.2f} → Current: ${current_price:,.2f}")
                         signal = None  # Don't sell yet
                     else:
-                        logger.info(f"✅ Profit target met: {profit_pct*100:.2f}% >= {self.min_profit_target*100:.2f}%")
+                        logger.info("✅ Profit target met: %.2f%% >= %.2f%%", profit_pct * 100, self.min_profit_target * 100)
 
                 # MINIMUM HOLD TIME CHECK
                 if signal == 'sell' and self.entry_time is not None:
-                    hold_time = time.time() - self.entry_time
+                    hold_time = now - self.entry_time
                     if hold_time < self.min_hold_time:
-                        logger.info(f"⚠️ SELL signal ignored - hold time too short:")
-                        logger.info(f"  Held for: {hold_time:.0f}s ({hold_time/60:.1f}min) < Min: {self.min_hold_time}s ({self.min_hold_time/60:.1f}min)")
+                        logger.info("⚠️ SELL signal ignored - hold time too short:")
+                        logger.info("  Held for: %.0fs (%.1fmin) < Min: %ss (%.1fmin)",
+                                    hold_time, hold_time / 60, self.min_hold_time, self.min_hold_time / 60)
                         signal = None  # Don't sell yet
 
         # Track entry price and time when buying
         if signal == 'buy':
             self.entry_price = current_price
-            self.entry_time = time.time()
-            logger.info(f"📊 Entry tracked: ${self.entry_price:,.2f} at {time.strftime('%H:%M:%S', time.localtime(self.entry_time))}")
+            self.entry_time = now
+            logger.info(f"📊 Entry tracked: ${self.entry_price:,.2f} at {time.strftime('%H:%M:%S', time.localtime())}")
 
         # Reset entry tracking when selling
         if signal == 'sell':
             self.entry_price = None
             self.entry_time = None
 
-        # Update previous SMAs
-        self.prev_fast_sma = fast_sma
-        self.prev_slow_sma = slow_sma
+        # Remember the SMA spread for the next tick
+        self.prev_sma_diff = sma_diff
 
         # Log trend if no signal
-        if signal is None:
-            trend = "BULLISH" if fast_sma > slow_sma else "BEARISH"
+        if signal is None and logger.isEnabledFor(logging.INFO):
+            trend = "BULLISH" if sma_diff > 0.0 else "BEARISH"
             position_info = f"Position: {self.position or 'None'}"
             if self.entry_price is not None:
                 profit_pct = (current_price - self.entry_price) / self.entry_price
-                hold_time = time.time() - self.entry_time if self.entry_time else 0
+                hold_time = now - self.entry_time if self.entry_time else 0
                 position_info += f" | P&L: {profit_pct*100:+.2f}% | Hold: {hold_time/60:.1f}min"
-            logger.info(f"Trend: {trend} (Fast {'>' if fast_sma > slow_sma else '<'} Slow) | {position_info}")
+            logger.info(f"Trend: {trend} (Fast {'>' if sma_diff > 0.0 else '<'} Slow) | {position_info}")
 
         return signal
 
-    def _find_pair_key(self, ticker_data: dict) -> Optional[str]:
-        """
-        Find the actual trading pair key in ticker response.
-
-        Args:
-            ticker_data: Ticker data dictionary
-
-        Returns:
-            Pair key or None
-        """
-        # Common pair variations
-        variations = ['XBTUSD', 'XXBTZUSD', 'BTCUSD', 'ETHUSD', 'XETHZUSD', 'SOLUSD', 'XRPUSD', 'XXRPZUSD']
-
-        for variation in variations:
-            if variation in ticker_data:
-                return variation
-
-        # Return first key if none match
-        if ticker_data:
-            return list(ticker_data.keys())[0]
-
-        return None
-
     def reset(self) -> None:
         """Reset strategy state."""
         super().reset()
-        self.prev_fast_sma = None
-        self.prev_slow_sma = None
+        self._reset_rolling()
+        self.prev_sma_diff = None
         self.entry_price = None
         self.entry_time = None
@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+import pytest
+
+import src.strategies.breakout as breakout_module
+from src.indicators import calculate_fibonacci_extensions, find_swing_high_low
+from src.strategies.breakout import BreakoutStrategy, _fib_extensions
+
+
+CONFIG = {
+    'HISTORY_SIZE': 60,
+    'ATR_PERIOD': 14,
+    'ATR_MULTIPLIER': 1.5,
+    'VOLUME_THRESHOLD': 1.5,
+    'BREAKOUT_LOOKBACK': 20,
+    'REQUIRE_RETEST': False,
+    'USE_FIBONACCI': True,
+    'FIB_LOOKBACK_PERIOD': 25,
+}
+
+
+def test_swing_points_track_sliding_window():
+    strategy = BreakoutStrategy(CONFIG)
+    rng = random.Random(11)
+    price = 100.0
+    for _ in range(200):
+        # Round so repeated values exercise the tie handling in the deques.
+        price = round(price * (1 + rng.gauss(0, 0.01)), 1)
+        strategy.add_price(price)
+        assert strategy._swing_points() == find_swing_high_low(strategy.get_prices(), CONFIG['FIB_LOOKBACK_PERIOD'])
+
+    strategy.reset()
+    assert strategy._swing_points() is None
+
+
+def test_fib_extensions_memoized_and_read_only():
+    levels = _fib_extensions(110.0, 90.0)
+    assert dict(levels) == calculate_fibonacci_extensions(110.0, 90.0)
+    assert _fib_extensions(110.0, 90.0) is levels
+    with pytest.raises(TypeError):
+        levels['127.2%'] = 0.0
+
+
+def test_breakout_instances_use_slots():
+    strategy = BreakoutStrategy(CONFIG)
+    assert not hasattr(strategy, '__dict__')
+    with pytest.raises(AttributeError):
+        strategy.unknown_attribute = 1
+
+
+def _breakout_ohlc(last_close):
+    closes = np.array([100.0] * 30 + [last_close])
+    volumes = np.array([1.0] * 30 + [10.0])
+    return {
+        'interval': 1,
+        'highs': closes + 1.0,
+        'lows': closes - 1.0,
+        'closes': closes,
+        'volumes': volumes,
+        'latest': {'time': 31, 'open': 100.0, 'high': last_close + 1.0, 'low': last_close - 1.0,
+                   'close': last_close, 'vwap': last_close, 'volume': 10.0, 'count': 1},
+    }
+
+
+def test_repeat_polls_rerun_when_state_changed(monkeypatch):
+    monkeypatch.setattr(breakout_module, '_cached_levels', lambda prices, fib_lookback: ((90.0,), (106.0,), None))
+    strategy = BreakoutStrategy({**CONFIG, 'REQUIRE_RETEST': True})
+
+    for _ in range(3):
+        assert strategy.analyze({'ohlc': _breakout_ohlc(105.5)}) is None
+
+    # An armed retest must be evaluated even though the candle has not changed.
+    strategy.breakout_confirmed = True
+    strategy.breakout_type = 'bullish'
+    assert strategy.analyze({'ohlc': _breakout_ohlc(105.5)}) == 'buy'
+    assert not strategy.breakout_confirmed
+
+
+def test_repeat_idle_polls_are_skipped(monkeypatch):
+    monkeypatch.setattr(breakout_module, '_cached_levels', lambda prices, fib_lookback: ((90.0,), (105.0,), None))
+    calls = []
+    atr = breakout_module.calculate_atr
+    monkeypatch.setattr(breakout_module, 'calculate_atr', lambda *args: calls.append(1) or atr(*args))
+    strategy = BreakoutStrategy(CONFIG)
+
+    for _ in range(4):
+        assert strategy.analyze({'ohlc': _breakout_ohlc(100.0)}) is None
+    # The first poll moves the nearest levels; the second confirms nothing changed.
+    assert len(calls) == 2
+    assert len(strategy.get_prices()) == 4
@@ -1,5 +1,6 @@
 """Tests for Kraken API client."""
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 from src.kraken.client import KrakenClient
 
@@ -83,3 +84,13 @@ class TestKrakenClient:
 
         with pytest.raises(Exception, match="Kraken API Error"):
             client.get_account_balance()
+
+    def test_session_is_per_thread(self):
+        """Test each thread gets its own session, reused across calls."""
+        client = KrakenClient()
+        assert client.session is client.session
+        assert client.session.headers['User-Agent'] == 'SpiceTrader/1.0'
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            worker_session = pool.submit(lambda: client.session).result()
+        assert worker_session is not client.session
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+from src.database import TradingDatabase
+
+
+def test_get_open_positions_batches_and_keeps_latest(tmp_path):
+    db = TradingDatabase(str(tmp_path / 'trading.db'))
+    try:
+        first = db.open_position('XBTUSD', 'macd', 'long', 100.0, 1.0)
+        latest = db.open_position('XBTUSD', 'macd', 'long', 110.0, 1.0)
+        closed = db.open_position('ETHUSD', 'grid_trading', 'long', 10.0, 1.0)
+        db.close_position(closed, exit_price=11.0, exit_volume=1.0)
+        sol = db.open_position('SOLUSD', 'breakout', 'long', 5.0, 2.0)
+
+        positions = db.get_open_positions(['XBTUSD', 'ETHUSD', 'SOLUSD', 'DOGEUSD'])
+
+        assert set(positions) == {'XBTUSD', 'SOLUSD'}
+        assert positions['XBTUSD']['id'] == latest != first
+        assert positions['XBTUSD'] == db.get_open_position('XBTUSD')
+        assert positions['SOLUSD']['id'] == sol
+        assert db.get_open_positions([]) == {}
+    finally:
+        db.close()
+
+
+def test_get_daily_stats_aggregates_positions_and_switches(tmp_path):
+    db = TradingDatabase(str(tmp_path / 'trading.db'))
+    try:
+        win = db.open_position('XBTUSD', 'macd', 'long', 100.0, 1.0)
+        db.close_position(win, exit_price=110.0, exit_volume=1.0)
+        loss = db.open_position('ETHUSD', 'breakout', 'long', 10.0, 1.0)
+        db.close_position(loss, exit_price=9.0, exit_volume=1.0)
+        db.open_position('SOLUSD', 'grid_trading', 'long', 5.0, 1.0)
+        db.record_strategy_switch('XBTUSD', 'macd', 'breakout', 'test', 'volatile_breakout', 0.9, 2, 1)
+
+        stats = db.get_daily_stats(datetime.now().date())
+
+        assert stats['total_trades'] == 2
+        assert stats['winning_trades'] == 1
+        assert stats['gross_pnl'] == 9.0
+        # Switch timestamps default to UTC (CURRENT_TIMESTAMP); positions use local time.
+        same_day = datetime.now(timezone.utc).date() == datetime.now().date()
+        assert stats['strategy_switches'] == (1 if same_day else 0)
+        assert set(stats['coins_traded'].split(',')) == {'XBTUSD', 'ETHUSD'}
+    finally:
+        db.close()
@@ -0,0 +1,67 @@
+import random
+
+from src.strategies.grid_trading import GridTradingStrategy
+
+
+CONFIG = {'HISTORY_SIZE': 50, 'GRID_SIZE': 10, 'GRID_SPACING_PCT': 0.5}
+
+
+def test_bracket_matches_linear_scan():
+    strategy = GridTradingStrategy(CONFIG)
+    strategy._initialize_grid(100.0)
+    assert strategy.buy_levels == sorted(strategy.buy_levels)
+    assert strategy.lower_bound == min(strategy.buy_levels)
+    assert strategy.upper_bound == max(strategy.sell_levels)
+
+    rng = random.Random(5)
+    probes = strategy.buy_levels + strategy.sell_levels + [rng.uniform(95.0, 105.0) for _ in range(200)]
+    for price in probes:
+        below = [level for level in strategy.buy_levels if level < price]
+        above = [level for level in strategy.sell_levels if level > price]
+        nearest_buy, nearest_sell = strategy._find_bracket(price)
+        assert nearest_buy == ((len(below) - 1, max(below)) if below else None)
+        assert nearest_sell == ((len(strategy.sell_levels) - len(above), min(above)) if above else None)
+
+
+def test_grid_levels_match_per_level_formula():
+    strategy = GridTradingStrategy(CONFIG)
+    center = 43210.5
+    strategy._initialize_grid(center)
+    spacing = CONFIG['GRID_SPACING_PCT']
+    half_grid = CONFIG['GRID_SIZE'] // 2
+    assert strategy.buy_levels == sorted(center * (1 - (spacing / 100) * i) for i in range(1, half_grid + 1))
+    assert strategy.sell_levels == sorted(center * (1 + (spacing / 100) * i) for i in range(1, half_grid + 1))
+    assert all(isinstance(level, float) for level in strategy.buy_levels + strategy.sell_levels)
+
+
+def test_trigger_bands_match_relative_tolerance():
+    strategy = GridTradingStrategy(CONFIG)
+    strategy._initialize_grid(2500.0)
+    rng = random.Random(9)
+    for levels, bands in ((strategy.buy_levels, strategy._buy_bands), (strategy.sell_levels, strategy._sell_bands)):
+        for idx, level in enumerate(levels):
+            low, high = bands[idx]
+            for _ in range(50):
+                price = level * (1 + rng.uniform(-0.002, 0.002))
+                assert (low < price < high) == (abs(price - level) / level < 0.001)
+
+
+def _tick(strategy, price):
+    return strategy.analyze({'ticker': {'XXBTZUSD': {'c': [str(price), '1.0']}}})
+
+
+def test_each_level_signals_once_until_recentered():
+    strategy = GridTradingStrategy(CONFIG)
+    for _ in range(11):
+        _tick(strategy, 100.0)
+    assert strategy.grid_center == 100.0
+
+    assert _tick(strategy, 99.51) == 'buy'
+    assert _tick(strategy, 99.51) is None
+    assert _tick(strategy, 100.49) == 'sell'
+    assert _tick(strategy, 100.49) is None
+    assert strategy.filled_buy_mask.bit_count() == 1
+    assert strategy.filled_sell_mask.bit_count() == 1
+
+    strategy._initialize_grid(100.0)
+    assert _tick(strategy, 99.51) == 'buy'
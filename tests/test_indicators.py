@@ -0,0 +1,83 @@
+import random
+
+import numpy as np
+
+from src.indicators import (
+    _cluster_levels,
+    calculate_bollinger_bands,
+    calculate_ema,
+    calculate_macd,
+    detect_support_resistance,
+    find_swing_high_low,
+    sum_in_order,
+)
+
+
+def _reference_support_resistance(prices, window, threshold):
+    # Original per-index scan.
+    if len(prices) < window * 2:
+        return ([], [])
+    support, resistance = [], []
+    for i in range(window, len(prices) - window):
+        if prices[i] == min(prices[i - window:i + window + 1]):
+            support.append(prices[i])
+        if prices[i] == max(prices[i - window:i + window + 1]):
+            resistance.append(prices[i])
+    return (_cluster_levels(support, threshold), _cluster_levels(resistance, threshold))
+
+
+def _reference_macd(prices, fast_period, slow_period, signal_period):
+    # Original formulation: EMAs recomputed over every prefix.
+    if len(prices) < slow_period + signal_period:
+        return None
+    fast_ema = calculate_ema(prices, fast_period)
+    slow_ema = calculate_ema(prices, slow_period)
+    if fast_ema is None or slow_ema is None:
+        return None
+    macd_values = []
+    for i in range(slow_period, len(prices) + 1):
+        f_ema = calculate_ema(prices[:i], fast_period)
+        s_ema = calculate_ema(prices[:i], slow_period)
+        if f_ema and s_ema:
+            macd_values.append(f_ema - s_ema)
+    signal_line = calculate_ema(macd_values, signal_period)
+    if signal_line is None:
+        return None
+    return (fast_ema - slow_ema, signal_line, fast_ema - slow_ema - signal_line)
+
+
+def test_detect_support_resistance_matches_scan():
+    rng = random.Random(2)
+    for _ in range(200):
+        n = rng.randint(0, 120)
+        window = rng.randint(0, 12)
+        prices = [round(100 * (1 + rng.gauss(0, 0.02)), rng.choice([1, 6])) for _ in range(n)]
+
+        expected = _reference_support_resistance(prices, window, 0.02)
+        assert detect_support_resistance(prices, window, 0.02) == expected
+        assert detect_support_resistance(np.asarray(prices), window, 0.02) == expected
+
+
+def test_find_swing_high_low_accepts_arrays():
+    prices = [3.0, 1.0, 4.0, 1.5, 9.0, 2.6]
+    assert find_swing_high_low(np.asarray(prices), 4) == find_swing_high_low(prices, 4) == (9.0, 1.5)
+    assert find_swing_high_low(np.asarray(prices), 7) is None
+
+
+def test_calculate_macd_matches_prefix_recompute():
+    rng = random.Random(6)
+    for _ in range(300):
+        n = rng.randint(1, 70)
+        fast, slow, signal = rng.randint(1, 12), rng.randint(1, 26), rng.randint(1, 9)
+        prices = [100 * (1 + rng.gauss(0, 0.02)) for _ in range(n)]
+        if rng.random() < 0.1:
+            prices = [0.0] * n  # zero EMAs are skipped
+        assert calculate_macd(prices, fast, slow, signal) == _reference_macd(prices, fast, slow, signal)
+
+
+def test_sum_in_order_adds_left_to_right():
+    # Compensated summation (sum() on Python 3.12+) would keep the 1.0.
+    values = [1e16, 1.0, -1e16]
+    assert sum_in_order(values) == 0.0
+    assert sum_in_order(iter([0.5, 0.25])) == 0.75
+    assert calculate_bollinger_bands(values, 3, 2.0)[1] == 0.0
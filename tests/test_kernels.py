@@ -0,0 +1,140 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from src.indicators import (
+    calculate_atr,
+    calculate_bollinger_bands,
+    calculate_macd,
+    calculate_rsi,
+    find_swing_high_low,
+)
+from src.strategies._kernels import (
+    _atr_is_high_python,
+    _macd_advance_python,
+    _rsi_bollinger_python,
+    atr_is_high_kernel,
+    macd_advance,
+    macd_from_state,
+    macd_kernel,
+    rsi_bollinger_kernel,
+)
+
+
+def _reference_atr_is_high(highs, lows, closes, period, lookback):
+    # Original per-window formulation from BreakoutStrategy.
+    n = len(closes)
+    if n < period + 2:
+        return False
+    start = max(period + 1, n - (lookback + period))
+    atr_vals = [
+        calculate_atr(highs[end - period - 1:end], lows[end - period - 1:end], closes[end - period - 1:end], period)
+        for end in range(start, n + 1)
+    ]
+    if len(atr_vals) < 3:
+        return False
+    avg_atr = sum(atr_vals[:-1]) / (len(atr_vals) - 1)
+    return avg_atr > 0 and atr_vals[-1] >= avg_atr
+
+
+def test_atr_is_high_kernel_matches_reference():
+    rng = random.Random(7)
+    for _ in range(300):
+        n = rng.randint(2, 80)
+        period = rng.randint(1, 15)
+        lookback = rng.choice([1, 2, 5, 20])
+        closes = [100 * (1 + rng.gauss(0, 0.01)) for _ in range(n)]
+        highs = [c * (1 + abs(rng.gauss(0, 0.005))) for c in closes]
+        lows = [c * (1 - abs(rng.gauss(0, 0.005))) for c in closes]
+
+        expected = _reference_atr_is_high(highs, lows, closes, period, lookback)
+        args = (np.asarray(highs), np.asarray(lows), np.asarray(closes), period, lookback)
+        assert (atr_is_high_kernel(*args) > 0.0) == expected
+        assert (_atr_is_high_python(*args) > 0.0) == expected
+
+
+def test_atr_is_high_kernel_constant_range_matches_reference():
+    # Every window has the same true ranges, so the current ATR ties its average
+    # or not depending only on summation order.
+    for close, spread in ((1.7, 0.1), (100.1, 0.07)):
+        for period in range(1, 16):
+            for lookback in (1, 5, 20):
+                closes = [close] * 60
+                highs = [close + spread] * 60
+                lows = [close - spread] * 60
+
+                expected = _reference_atr_is_high(highs, lows, closes, period, lookback)
+                args = (np.asarray(highs), np.asarray(lows), np.asarray(closes), period, lookback)
+                assert (atr_is_high_kernel(*args) > 0.0) == expected
+                assert (_atr_is_high_python(*args) > 0.0) == expected
+
+
+def test_atr_is_high_kernel_flat_series_is_not_high():
+    flat = np.full(40, 5.0)
+    assert atr_is_high_kernel(flat, flat, flat, 14, 20) == 0.0
+
+
+def test_macd_kernel_matches_calculate_macd():
+    rng = random.Random(3)
+    for _ in range(300):
+        n = rng.randint(1, 90)
+        fast, slow, signal = rng.randint(1, 12), rng.randint(1, 26), rng.randint(1, 9)
+        prices = [100 * (1 + rng.gauss(0, 0.02)) for _ in range(n)]
+
+        expected = calculate_macd(prices, fast, slow, signal)
+        for advance in (macd_advance, _macd_advance_python):
+            state = advance(np.asarray(prices), 0, 0.0, 0.0, 0.0, 0, fast, slow, signal)
+            result = macd_from_state(n, state, fast, slow, signal)
+            if expected is None:
+                assert all(math.isnan(value) for value in result)
+            else:
+                assert result == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_macd_advance_resumes_exactly():
+    rng = random.Random(8)
+    prices = np.asarray([100 * (1 + rng.gauss(0, 0.02)) for _ in range(80)])
+    fast, slow, signal = 12, 26, 9
+
+    state = (0.0, 0.0, 0.0, 0)
+    for i in range(len(prices)):
+        state = macd_advance(prices[i:i + 1], i, *state, fast, slow, signal)
+        expected = macd_kernel(prices[:i + 1], fast, slow, signal)
+        result = macd_from_state(i + 1, state, fast, slow, signal)
+        assert result == expected or all(math.isnan(value) for value in result + expected)
+
+
+def test_rsi_bollinger_kernel_matches_indicators():
+    rng = random.Random(11)
+    for _ in range(300):
+        n = rng.randint(1, 60)
+        rsi_period, bb_period = rng.randint(1, 20), rng.randint(1, 25)
+        prices = [100 * (1 + rng.gauss(0, 0.02)) for _ in range(n)]
+        if rng.random() < 0.1:
+            prices = sorted(prices)  # no losses: RSI pinned at 100
+
+        swing_period = rng.randint(1, 60)
+
+        expected_rsi = calculate_rsi(prices, rsi_period)
+        expected_bb = calculate_bollinger_bands(prices, bb_period, 2.0)
+        expected_swing = find_swing_high_low(prices, swing_period)
+        # The indicators add in plain order (sum_in_order), like the kernels, so both
+        # backends must reproduce them exactly on every Python version.
+        for kernel in (rsi_bollinger_kernel, _rsi_bollinger_python):
+            rsi, upper, middle, lower, swing_high, swing_low = kernel(
+                np.asarray(prices), rsi_period, bb_period, 2.0, swing_period
+            )
+            if expected_swing is None:
+                assert math.isnan(swing_high) and math.isnan(swing_low)
+            else:
+                assert (swing_high, swing_low) == expected_swing
+            if expected_rsi is None:
+                assert math.isnan(rsi)
+            else:
+                assert rsi == expected_rsi
+            if expected_bb is None:
+                assert all(math.isnan(value) for value in (upper, middle, lower))
+            else:
+                assert (upper, middle, lower) == expected_bb
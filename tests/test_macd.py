@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from src.indicators import calculate_macd
+from src.strategies.macd import MACDStrategy
+
+
+CONFIG = {
+    'HISTORY_SIZE': 50,
+    'MACD_FAST': 5,
+    'MACD_SLOW': 10,
+    'MACD_SIGNAL': 4,
+    'MACD_HISTOGRAM_CONFIRM': False,
+}
+
+
+def test_macd_matches_full_recompute_while_growing_and_sliding():
+    strategy = MACDStrategy(CONFIG)
+    rng = random.Random(2)
+    price = 100.0
+    for _ in range(120):
+        price *= 1 + rng.gauss(0, 0.01)
+        strategy.analyze({'ticker': {'XBTUSD': {'c': [str(price)]}}})
+        expected = calculate_macd(strategy.get_prices(), 5, 10, 4)
+        if expected is not None:
+            assert (strategy.prev_macd_line, strategy.prev_signal_line) == pytest.approx(expected[:2], rel=1e-12)
+
+
+@pytest.mark.parametrize('confirm', [False, True])
+def test_analyze_many_matches_tick_by_tick(confirm):
+    config = dict(CONFIG, MACD_HISTOGRAM_CONFIRM=confirm)
+    rng = random.Random(6)
+    prices = [100.0]
+    for _ in range(299):
+        prices.append(prices[-1] * (1 + rng.gauss(0, 0.01)))
+
+    strategy = MACDStrategy(config)
+    expected = []
+    for price in prices:
+        signal = strategy.analyze({'ticker': {'XBTUSD': {'c': [repr(price)]}}})
+        expected.append({'buy': 1, 'sell': -1}.get(signal, 0))
+
+    signals = MACDStrategy(config).analyze_many(prices)
+    assert signals.tolist() == expected
+    assert any(expected)
@@ -1,4 +1,6 @@
-from src.market_data import OHLCCache
+import pytest
+
+from src.market_data import OHLCCache, annotate_last_price, ticker_last_price
 
 
 class _FakeClient:
@@ -24,10 +26,10 @@ def test_ohlc_cache_drops_last_uncommitted_candle():
 
     series = cache.get_series('XBTUSD')
     assert series is not None
-    assert series['closes'] == [1.5, 2.0]
-    assert series['highs'] == [2.0, 2.5]
-    assert series['lows'] == [0.5, 1.0]
-    assert series['volumes'] == [10.0, 12.0]
+    assert series['closes'].tolist() == [1.5, 2.0]
+    assert series['highs'].tolist() == [2.0, 2.5]
+    assert series['lows'].tolist() == [0.5, 1.0]
+    assert series['volumes'].tolist() == [10.0, 12.0]
     assert series['latest']['time'] == 200
 
 
@@ -59,4 +61,54 @@ def test_ohlc_cache_merges_by_timestamp():
     assert series is not None
     # Expect candles at 100, 200(updated), 400; and 500 dropped.
     assert [series['latest']['time']] == [400]
-    assert series['closes'] == [1.5, 2.1, 2.6]
+    assert series['closes'].tolist() == [1.5, 2.1, 2.6]
+
+
+def test_ohlc_cache_keeps_last_maxlen_candles_across_buffer_wrap():
+    cache = OHLCCache(interval=1, maxlen=4)
+    for t in range(1, 12):
+        # Committed candle t plus the uncommitted candle t + 1.
+        rows = [[t * 60, '1', str(t + 1), '0.5', str(t), '1', '3', 1], [(t + 1) * 60, '1', '1', '1', '1', '1', '1', 1]]
+        cache.update(_FakeClient({'XXBTZUSD': rows, 'last': t * 60}), 'XBTUSD')
+
+        series = cache.get_series('XBTUSD')
+        expected = [float(c) for c in range(max(1, t - 3), t + 1)]
+        assert series['closes'].tolist() == expected
+        assert series['highs'].tolist() == [c + 1 for c in expected]
+        assert series['latest']['close'] == float(t)
+        assert cache.get_latest_committed('XBTUSD').time == t * 60
+
+    with pytest.raises(ValueError):
+        series['closes'][0] = 0.0
+
+
+def test_ohlc_cache_series_are_not_modified_by_later_updates():
+    cache = OHLCCache(interval=1, maxlen=3)
+    retained = []
+    for t in range(1, 10):
+        # Re-send candle t - 1 with a revised close, commit candle t, plus the uncommitted t + 1.
+        rows = [
+            [(t - 1) * 60, '1', '1', '1', str(t - 1 + 0.5), '1', '1', 1],
+            [t * 60, '1', '1', '1', str(t), '1', '1', 1],
+            [(t + 1) * 60, '1', '1', '1', '1', '1', '1', 1],
+        ]
+        cache.update(_FakeClient({'XXBTZUSD': rows, 'last': t * 60}), 'XBTUSD')
+        series = cache.get_series('XBTUSD')
+        retained.append((series['closes'], series['closes'].tolist()))
+
+    assert series['closes'].tolist() == [7.5, 8.5, 9.0]
+    for closes, snapshot in retained:
+        assert closes.tolist() == snapshot
+
+
+def test_ticker_last_price_prefers_annotated_value():
+    entry = {'c': ['101.25', '0.5']}
+    assert ticker_last_price(entry) == 101.25
+
+    annotate_last_price(entry)
+    assert entry['c_float'] == 101.25
+    assert ticker_last_price(entry) == 101.25
+
+    malformed = {'c': []}
+    annotate_last_price(malformed)
+    assert 'c_float' not in malformed
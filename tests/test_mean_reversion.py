@@ -0,0 +1,69 @@
+import math
+import random
+
+import pytest
+
+import src.strategies.mean_reversion as mean_reversion
+from src.indicators import calculate_fibonacci_retracement
+from src.strategies._kernels import rsi_bollinger_kernel
+from src.strategies.mean_reversion import MeanReversionStrategy, _fib_retracement
+
+
+CONFIG = {
+    'HISTORY_SIZE': 40, 'RSI_PERIOD': 14, 'RSI_OVERSOLD': 30, 'RSI_OVERBOUGHT': 70,
+    'BB_PERIOD': 20, 'BB_STD_DEV': 2.0, 'AUTO_DETECT_LEVELS': 'false', 'USE_FIBONACCI': 'false',
+    'FIB_LOOKBACK_PERIOD': 50, 'FIB_TOLERANCE': 1.0, 'MIN_PROFIT_TARGET': 0.01,
+}
+
+
+def test_rolling_rsi_bollinger_matches_kernel():
+    strategy = MeanReversionStrategy(CONFIG, symbol='XBTUSD')
+    rng = random.Random(4)
+    price = 65000.0
+    for step in range(300):
+        if rng.random() > 0.3 and not 200 <= step < 230:  # include unchanged prices and a flat run
+            price *= 1 + rng.gauss(0, 0.004)
+        strategy.add_price(price)
+        if step == 150:
+            strategy.reset()
+
+        rolling = strategy._rolling_rsi_bollinger()
+        expected = rsi_bollinger_kernel(strategy.get_prices_array(), 14, 20, 2.0, 50)[:4]
+        for value, reference in zip(rolling, expected):
+            if math.isnan(reference):
+                assert math.isnan(value)
+            else:
+                assert value == pytest.approx(reference, rel=1e-9, abs=1e-6)
+        if not math.isnan(expected[0]) and expected[0] in (0.0, 100.0):
+            assert rolling[0] == expected[0]
+
+
+def test_fib_retracement_is_memoized_and_read_only():
+    levels = _fib_retracement(0.00001334, 0.00001234)
+    assert dict(levels) == calculate_fibonacci_retracement(0.00001334, 0.00001234)
+    assert _fib_retracement(0.00001334, 0.00001234) is levels
+    assert dict(_fib_retracement(0.00001334, 0.00001233)) != dict(levels)
+    with pytest.raises(TypeError):
+        levels['50.0%'] = 0.0
+
+
+def test_repeat_poll_on_same_candle_is_skipped(monkeypatch):
+    calls = []
+
+    def counting_kernel(*args):
+        calls.append(1)
+        return rsi_bollinger_kernel(*args)
+
+    monkeypatch.setattr(mean_reversion, 'rsi_bollinger_kernel', counting_kernel)
+    strategy = MeanReversionStrategy(dict(CONFIG, BREAKOUT_LOWER=0, BREAKOUT_UPPER=1e9), symbol='XBTUSD')
+    rng = random.Random(2)
+    closes = [65000 * (1 + rng.gauss(0, 0.004)) for _ in range(30)]
+    market_data = {'ohlc': {'closes': closes, 'latest': {'time': 60, 'close': closes[-1]}}}
+
+    assert strategy.analyze(market_data) is None
+    assert strategy.analyze(market_data) is None
+    assert len(calls) == 1
+
+    strategy.update_position('long')  # state the decision depends on changed
+    strategy.analyze(market_data)
+    assert len(calls) == 2
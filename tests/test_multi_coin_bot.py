@@ -0,0 +1,98 @@
+import pytest
+
+import src.multi_coin_bot as multi_coin_bot
+from src.database import TradingDatabase
+from src.multi_coin_bot import MultiCoinBot
+
+
+CONFIG = {
+    'TRADING_PAIRS': 'XBTUSD,ETHUSD,SOLUSD',
+    'DRY_RUN': 'true',
+    'API_CALL_DELAY': '0',
+    'MAX_TOTAL_EXPOSURE': '25',
+    'MAX_PER_COIN': '25',
+    'POSITION_SIZING_MODE': 'percent',
+    'FEE_BUFFER_PCT': '1',
+    'OHLC_INTERVAL': '1',
+    'ORDER_SIZE': '0.0001',
+    'TRACK_FEES': 'true',
+    'MAKER_FEE': '0.0016',
+    'TAKER_FEE': '0.0026',
+    'REANALYSIS_INTERVAL': '600',
+    'SWITCH_COOLDOWN': '1200',
+    'CONFIRMATIONS_REQUIRED': '2',
+    'MAX_SWITCHES_PER_DAY': '4',
+    'ADX_STRONG_TREND': '25',
+    'ADX_WEAK_TREND': '20',
+    'CHOPPINESS_CHOPPY': '61.8',
+    'CHOPPINESS_TRENDING': '38.2',
+    'RANGE_TIGHT': '5',
+    'RANGE_MODERATE': '15',
+    'ADX_PERIOD': '14',
+    'ATR_PERIOD': '14',
+    'CHOP_PERIOD': '14',
+    'SLOPE_PERIOD': '14',
+    'RANGE_PERIOD': '50',
+    'ANALYSIS_CACHE_TTL': '30',
+}
+
+
+class _FakeClient:
+    def get_trade_balance(self, asset='ZUSD'):
+        return {'eb': '1000'}
+
+    def get_ticker(self, pair):
+        return {symbol: {'c': ['100.0', '1'], 'v': ['1', '2']} for symbol in ('XBTUSD', 'ETHUSD', 'SOLUSD')}
+
+    def get_tradable_pairs(self, pair=None):
+        return {}
+
+    def get_ohlc(self, pair, interval=1, since=None):
+        return {}
+
+
+class _Strategy:
+    position = None
+    last_signal = None
+
+    def update_position(self, position):
+        self.position = position
+
+    def update_signal(self, signal):
+        self.last_signal = signal
+
+
+@pytest.fixture
+def bot(tmp_path, monkeypatch):
+    db_path = str(tmp_path / 'trading.db')
+    monkeypatch.setattr(multi_coin_bot, 'TradingDatabase', lambda: TradingDatabase(db_path))
+    bot = MultiCoinBot('key', 'secret', dict(CONFIG))
+    bot.client = _FakeClient()
+    yield bot
+    bot.stop()
+    bot.db.close()
+
+
+def test_buys_past_the_exposure_budget_are_skipped_but_sells_still_run(bot):
+    bot.db.open_position('SOLUSD', 'macd', 'long', 90.0, 1.0)
+    for symbol, signal in (('XBTUSD', 'buy'), ('ETHUSD', 'buy'), ('SOLUSD', 'sell')):
+        trader = bot.traders[symbol]
+        trader.current_strategy = _Strategy()
+        trader.analyze = lambda market_data, signal=signal: signal
+
+    bot.run_iteration()
+
+    # The first BUY takes the whole 25% budget; the SELL after the skipped BUY still exits.
+    assert set(bot.db.get_open_positions(['XBTUSD', 'ETHUSD', 'SOLUSD'])) == {'XBTUSD'}
+    assert bot.traders['ETHUSD'].current_strategy.last_signal is None
+    assert bot.traders['SOLUSD'].current_strategy.last_signal == 'sell'
+
+
+def test_summary_totals_read_the_traders(bot, capsys):
+    bot.traders['XBTUSD'].cumulative_fees = 1.25
+    bot.traders['XBTUSD'].gross_pnl = 4.0
+    bot.traders['ETHUSD'].net_pnl = -0.5
+
+    bot._display_summary()
+
+    assert "Total Fees: $1.25 | Gross P&L: $4.00 | Net P&L: $-0.50" in capsys.readouterr().out
@@ -1,7 +1,7 @@
 import pytest
 
 
-from src.kraken.client import KrakenClient
+from src.kraken.client import KrakenClient, _parse_rule_bundle
 
 
 def test_normalize_order_rounds_volume_and_price_down():
@@ -58,3 +58,23 @@ def test_normalize_order_enforces_costmin_when_price_known():
             price=100.0,
             current_price=100.0,
         )
+
+
+def test_normalize_order_reuses_parsed_rules():
+    rules = {'lot_decimals': 4, 'pair_decimals': 2, 'tick_size': '0.05', 'ordermin': '0.0100'}
+
+    KrakenClient.normalize_order_with_rules(rules, ordertype='limit', volume=0.5, price=100.03)
+    hits = _parse_rule_bundle.cache_info().hits
+    vol, px = KrakenClient.normalize_order_with_rules(dict(rules), ordertype='limit', volume=0.5, price=99.99)
+
+    assert _parse_rule_bundle.cache_info().hits == hits + 1
+    assert (vol, px) == (0.5, 99.95)
+
+
+def test_normalize_order_rounds_the_decimal_value_not_the_binary_float():
+    # 0.29 * 100 == 28.999999999999996 in binary floating point.
+    rules = {'lot_decimals': 2, 'pair_decimals': 2}
+
+    vol, px = KrakenClient.normalize_order_with_rules(rules, ordertype='limit', volume=0.29, price=1.13)
+
+    assert (vol, px) == (0.29, 1.13)
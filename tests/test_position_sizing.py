@@ -19,3 +19,10 @@ def test_equal_split_quote_allocation_guards():
     assert equal_split_quote_allocation(100.0, -1) == 0.0
     assert equal_split_quote_allocation(100.0, 2, fee_buffer_pct=100.0) == 0.0
     assert equal_split_quote_allocation(100.0, 2, exposure_pct=0.0) == 0.0
+
+
+def test_equal_split_quote_allocation_rounds_once():
+    # 94849 * 96% / 5 = 18211.008 exactly; chained float products gave 18211.007999999998.
+    assert equal_split_quote_allocation(94849.0, 5, fee_buffer_pct=0.0, exposure_pct=96.0) == 18211.008
+    # 87859 * 37% * 99% / 4 = 8045.687925
+    assert equal_split_quote_allocation(87859.0, 4, fee_buffer_pct=1.0, exposure_pct=37.0) == 8045.687925
@@ -0,0 +1,66 @@
+import random
+
+import src.strategies.sma_crossover as sma_crossover
+from src.indicators import calculate_sma
+from src.strategies.sma_crossover import SMACrossoverStrategy
+
+
+CONFIG = {
+    'HISTORY_SIZE': 30, 'FAST_SMA_PERIOD': 5, 'SLOW_SMA_PERIOD': 12,
+    'MIN_PROFIT_TARGET': 0.0, 'MIN_HOLD_TIME': 0, 'ENABLE_TREND_FILTER': 'false',
+}
+
+
+def test_rolling_smas_order_like_calculate_sma():
+    strategy = SMACrossoverStrategy(CONFIG)
+    rng = random.Random(9)
+    price = 0.00001234
+    for step in range(400):
+        if rng.random() > 0.3 and not 200 <= step < 240:  # include a flat run: exact ties
+            price *= 1 + rng.gauss(0, 0.004)
+        strategy.add_price(price)
+        if step == 150:
+            strategy.reset()
+        if not strategy.has_sufficient_data(12):
+            continue
+
+        prices = strategy.get_prices()
+        exact_fast, exact_slow = calculate_sma(prices, 5), calculate_sma(prices, 12)
+        fast, slow = strategy._rolling_smas()
+        assert (fast > slow) == (exact_fast > exact_slow)
+        assert (fast < slow) == (exact_fast < exact_slow)
+        assert abs(fast - exact_fast) <= 1e-12 * exact_fast
+        if strategy._roll_ticks == 0:  # just resynced: summed exactly as calculate_sma sums
+            assert (fast, slow) == (exact_fast, exact_slow)
+
+
+def test_crossover_from_a_tie_still_fires():
+    closes = [100.0] * 12 + [101.0]
+    market_data = {'ohlc': {'closes': closes, 'latest': {'time': 60, 'close': closes[-1]}}}
+
+    strategy = SMACrossoverStrategy(CONFIG)
+    strategy.prev_sma_diff = 0.0  # fast == slow on the previous tick
+    assert strategy.analyze(market_data) == 'buy'
+
+    strategy = SMACrossoverStrategy(CONFIG)
+    strategy.prev_sma_diff = 0.0
+    assert strategy.analyze({'ohlc': {'closes': [100.0] * 12 + [99.0]}}) == 'sell'
+
+
+def test_min_hold_time_uses_monotonic_clock(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(sma_crossover.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(sma_crossover.time, 'time', lambda: 10 ** 10)  # wall clock jumped
+    strategy = SMACrossoverStrategy(dict(CONFIG, MIN_HOLD_TIME=60))
+
+    strategy.prev_sma_diff = 0.0
+    assert strategy.analyze({'ohlc': {'closes': [100.0] * 12 + [101.0]}}) == 'buy'
+    assert strategy.entry_time == 1000.0
+
+    clock[0] += 30
+    strategy.prev_sma_diff = 0.0
+    assert strategy.analyze({'ohlc': {'closes': [102.0] * 12 + [101.5]}}) is None
+
+    clock[0] += 60
+    strategy.prev_sma_diff = 0.0
+    assert strategy.analyze({'ohlc': {'closes': [102.0] * 12 + [101.5]}}) == 'sell'
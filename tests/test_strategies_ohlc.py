@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+import numpy as np
+
 from src.strategies.sma_crossover import SMACrossoverStrategy
 from src.strategies.macd import MACDStrategy
 from src.strategies.mean_reversion import MeanReversionStrategy
@@ -9,30 +11,49 @@ from src.indicators import calculate_macd
 
 
 def _make_ohlc(closes: List[float]) -> Dict[str, object]:
-    highs = [c * 1.01 for c in closes]
-    lows = [c * 0.99 for c in closes]
-    volumes = [1.0 for _ in closes]
+    # Same shape as OHLCCache.get_series: float64 columns, Python scalars in 'latest'.
+    closes_arr = np.asarray(closes, dtype=np.float64)
+    highs = closes_arr * 1.01
+    lows = closes_arr * 0.99
+    volumes = np.ones_like(closes_arr)
+    for column in (closes_arr, highs, lows, volumes):
+        column.setflags(write=False)
     return {
         'interval': 1,
         'highs': highs,
         'lows': lows,
-        'closes': list(closes),
+        'closes': closes_arr,
         'volumes': volumes,
         'latest': {
             'time': len(closes),
-            'open': closes[-1],
-            'high': highs[-1],
-            'low': lows[-1],
-            'close': closes[-1],
-            'vwap': closes[-1],
-            'volume': volumes[-1],
+            'open': float(closes_arr[-1]),
+            'high': float(highs[-1]),
+            'low': float(lows[-1]),
+            'close': float(closes_arr[-1]),
+            'vwap': float(closes_arr[-1]),
+            'volume': float(volumes[-1]),
             'count': 1,
         },
     }
 
 
+def test_make_ohlc_matches_cache_series_layout():
+    ohlc = _make_ohlc([10, 11, 12])
+
+    for key in ('highs', 'lows', 'closes', 'volumes'):
+        column = ohlc[key]
+        assert isinstance(column, np.ndarray) and column.dtype == np.float64
+        assert not column.flags.writeable
+    assert ohlc['highs'].tolist() == [c * 1.01 for c in (10.0, 11.0, 12.0)]
+    assert ohlc['lows'].tolist() == [c * 0.99 for c in (10.0, 11.0, 12.0)]
+    assert ohlc['volumes'].tolist() == [1.0, 1.0, 1.0]
+    assert ohlc['latest']['high'] == ohlc['highs'][-1]
+    assert type(ohlc['latest']['close']) is float
+
+
 def test_sma_crossover_uses_ohlc_and_emits_buy_on_bullish_cross():
     config = {
+        'HISTORY_SIZE': 50,
         'FAST_SMA_PERIOD': 3,
         'SLOW_SMA_PERIOD': 5,
         'ENABLE_TREND_FILTER': 'false',
@@ -44,12 +65,19 @@ def test_sma_crossover_uses_ohlc_and_emits_buy_on_bullish_cross():
     series1 = [10, 10, 10, 10, 10]
     series2 = [10, 10, 10, 10, 10, 12]
 
-    assert strat.analyze({'ohlc': _make_ohlc(series1), 'ticker': {}}) is None
-    assert strat.analyze({'ohlc': _make_ohlc(series2), 'ticker': {}}) == 'buy'
+    ohlc1, ohlc2 = _make_ohlc(series1), _make_ohlc(series2)
+    assert isinstance(ohlc2['closes'], np.ndarray) and ohlc2['closes'].dtype == np.float64
+
+    assert strat.analyze({'ohlc': ohlc1, 'ticker': {}}) is None
+    assert strat.analyze({'ohlc': ohlc2, 'ticker': {}}) == 'buy'
+    # The OHLC path fed the committed closes, not the (empty) ticker.
+    assert strat.get_prices() == [10.0, 12.0]
+    assert strat.entry_price == 12.0
 
 
 def test_macd_uses_ohlc_and_emits_buy_on_bullish_cross():
     config = {
+        'HISTORY_SIZE': 50,
         'MACD_FAST': 3,
         'MACD_SLOW': 6,
         'MACD_SIGNAL': 3,
@@ -78,10 +106,12 @@ def test_macd_uses_ohlc_and_emits_buy_on_bullish_cross():
 
     assert strat.analyze({'ohlc': _make_ohlc(base), 'ticker': {}}) is None
     assert strat.analyze({'ohlc': _make_ohlc(series2), 'ticker': {}}) == 'buy'
+    assert (strat.prev_macd_line, strat.prev_signal_line) == calculate_macd(series2, 3, 6, 3)[:2]
 
 
 def test_mean_reversion_uses_ohlc_and_emits_buy_near_support():
     config = {
+        'HISTORY_SIZE': 50,
         'RSI_PERIOD': 5,
         'RSI_OVERSOLD': 80,
         'RSI_OVERBOUGHT': 90,
@@ -89,6 +119,8 @@ def test_mean_reversion_uses_ohlc_and_emits_buy_near_support():
         'BB_STD_DEV': 0.5,
         'AUTO_DETECT_LEVELS': 'false',
         'USE_FIBONACCI': 'false',
+        'FIB_LOOKBACK_PERIOD': 50,
+        'FIB_TOLERANCE': 1.0,
         'SUPPORT_LEVEL': 85,
         'RESISTANCE_LEVEL': 110,
         'SUPPORT_ZONE': 5,
@@ -105,3 +137,4 @@ def test_mean_reversion_uses_ohlc_and_emits_buy_near_support():
 
     signal = strat.analyze({'ohlc': _make_ohlc(closes), 'ticker': {}})
     assert signal == 'buy'
+    assert strat.entry_price == 85.0
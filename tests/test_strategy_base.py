@@ -0,0 +1,61 @@
+from src.strategies.base import TradingStrategy
+
+
+class _Strategy(TradingStrategy):
+    def analyze(self, market_data):
+        return None
+
+    def get_strategy_name(self):
+        return "test"
+
+
+def test_price_ring_matches_history_across_wraparound():
+    strategy = _Strategy({'HISTORY_SIZE': 5})
+    for i in range(12):
+        strategy.add_price(100.0 + i)
+        assert strategy.get_prices() == list(strategy.price_history)
+        assert strategy.get_prices_array().tolist() == list(strategy.price_history)
+
+
+def test_has_sufficient_data_follows_capped_history():
+    strategy = _Strategy({'HISTORY_SIZE': 3})
+    for i in range(5):
+        strategy.add_price(float(i))
+        assert strategy.has_sufficient_data(3) == (len(strategy.price_history) >= 3)
+    assert not strategy.has_sufficient_data(4)
+
+    strategy.reset()
+    assert not strategy.has_sufficient_data(1)
+
+
+def test_price_cache_reused_until_next_price():
+    strategy = _Strategy({'HISTORY_SIZE': 3})
+    strategy.add_price(1.0)
+    first = strategy.get_prices_array()
+    assert strategy.get_prices_array() is first
+    assert not first.flags.writeable
+
+    strategy.add_price(2.0)
+    assert strategy.get_prices_array() is not first
+    assert strategy.get_prices() == [1.0, 2.0]
+
+    strategy.reset()
+    assert strategy.get_prices() == []
+
+
+def test_find_pair_key_prefers_variation_order():
+    strategy = _Strategy({'HISTORY_SIZE': 3})
+    assert strategy._find_pair_key({'ETHUSD': {}, 'XXBTZUSD': {}, 'XBTUSD': {}}) == 'XBTUSD'
+    assert strategy._find_pair_key({'OTHER': {}, 'SOLUSD': {}}) == 'SOLUSD'
+    assert strategy._find_pair_key({'ADAUSD': {}, 'DOTUSD': {}}) == 'ADAUSD'
+    assert strategy._find_pair_key({}) is None
+
+
+def test_resolved_pair_key_reused_until_missing():
+    strategy = _Strategy({'HISTORY_SIZE': 3})
+    assert strategy._resolve_pair_key({'ADAUSD': {}}) == 'ADAUSD'
+    # Still present: kept even though a preferred variation has appeared.
+    assert strategy._resolve_pair_key({'XBTUSD': {}, 'ADAUSD': {}}) == 'ADAUSD'
+    assert strategy._resolve_pair_key({'XBTUSD': {}}) == 'XBTUSD'
+    strategy.reset()
+    assert strategy._pair_key is None